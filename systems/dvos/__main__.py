@@ -0,0 +1,167 @@
+# DVOS Command Line — Lightweight Entry Point
+# Usage (from the repo root):
+#   python -m systems.dvos analyze | verify | heal [--dry-run] | cycle | generate | feeds | schedule
+#   python -m systems.dvos history recent -n 10
+#   python -m systems.dvos blobs dedupe
+#   python -m systems.dvos backfill _posts --per-day
+#   python -m systems.dvos daemon   /   python -m systems.dvos ctl status
+# Each subcommand imports only the engine modules it needs, so cron and CI
+# invocations do not pay for Pillow, requests or the full stage stack up front.
+
+import argparse
+import os
+import sys
+
+DVOS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Engine modules import each other as `engine.*`, relative to systems/dvos
+if DVOS_DIR not in sys.path:
+    sys.path.insert(0, DVOS_DIR)
+
+
+# --- Subcommands -----------------------------------------------------------
+
+def cmd_analyze(args):
+    from engine.analyzer import run_analysis
+    run_analysis()
+    return 0
+
+
+def cmd_verify(args):
+    from engine.integrity_verifier import run_integrity_verifier
+    issues = run_integrity_verifier()
+    return 1 if any(issues.values()) else 0
+
+
+def cmd_heal(args):
+    from engine.dvos_cycle import detect_asset_mismatches
+    from engine.auto_healer import heal_assets
+    from engine.mismatch_scanner import save_state
+    # Manual runs repair every current mismatch, not just the ones new since the last cycle
+    mismatches = detect_asset_mismatches()
+    try:
+        heal_assets(mismatches, dry_run=args.dry_run, strict=True)
+    except Exception:
+        return 1  # batch rolled back; the healer has already reported why
+    if not args.dry_run:
+        save_state(mismatches)
+    return 0
+
+
+def cmd_cycle(args):
+    from dvos_scheduler import run_dvos_cycle
+    result = run_dvos_cycle()
+    return 1 if result.get("status") == "error" else 0
+
+
+def cmd_generate(args):
+    from engine.generate_content import generate, regenerate
+    if args.regenerate:
+        regenerate(workers=args.workers)
+    else:
+        generate(args.date, args.seed)
+    return 0
+
+
+def cmd_feeds(args):
+    from engine.site_feeds import build_feeds
+    result = build_feeds()
+    print(f"[FEEDS] {result['posts']} posts — {result['feed_entries']} feed entries, "
+          f"{result['sitemap_chunks']} sitemap chunk(s).")
+    return 0
+
+
+def cmd_schedule(args):
+    from dvos_scheduler import log_cycle, run_scheduler
+    try:
+        run_scheduler()
+    except KeyboardInterrupt:
+        log_cycle("Scheduler stopped manually.")
+        print("\n🟥 DVOS Scheduler stopped.")
+    return 0
+
+
+def cmd_daemon(args):
+    from dvos_daemon import run_daemon
+    run_daemon(args.socket, schedule=not args.no_schedule)
+    return 0
+
+
+def cmd_ctl(args):
+    import json
+    from dvos_daemon import send_command
+    response = send_command(" ".join(args.control), args.socket)
+    print(json.dumps(response, indent=2, default=str))
+    return 0 if response.get("ok") else 1
+
+
+def cmd_backfill(args):
+    from engine.bulk_commit import main as backfill_main
+    return backfill_main(args.backfill)
+
+
+def cmd_blobs(args):
+    from engine.blob_store import main as blobs_main
+    return blobs_main(args.action)
+
+
+def cmd_history(args):
+    from engine.cycle_history import main as history_main
+    history_main(args.query)
+    return 0
+
+
+# --- Entry -----------------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m systems.dvos", description="DVOS runtime commands.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("analyze", help="scan asset sources and rebuild the merged asset map").set_defaults(func=cmd_analyze)
+    sub.add_parser("verify", help="run integrity checks on the merged asset map").set_defaults(func=cmd_verify)
+
+    heal = sub.add_parser("heal", help="detect descriptor/asset mismatches and repair them")
+    heal.add_argument("--dry-run", action="store_true", help="report the repair plan without writing")
+    heal.set_defaults(func=cmd_heal)
+
+    sub.add_parser("cycle", help="run one full scheduler cycle").set_defaults(func=cmd_cycle)
+    generate = sub.add_parser("generate", help="generate today's article into _posts/ (seeded, cached)")
+    generate.add_argument("--date", help="publish date YYYY-MM-DD (default: today, UTC)")
+    generate.add_argument("--seed", default=os.environ.get("DVOS_SEED", "fullsend"), help="niche selection seed")
+    generate.add_argument("--regenerate", action="store_true", help="re-render posts whose template changed")
+    generate.add_argument("--workers", type=int, default=0, help="parallel workers for --regenerate (0 = CPU count)")
+    generate.set_defaults(func=cmd_generate)
+    sub.add_parser("feeds", help="rebuild feed.xml and sitemap.xml from _posts front matter").set_defaults(func=cmd_feeds)
+    sub.add_parser("schedule", help="run cycles continuously on the registry interval").set_defaults(func=cmd_schedule)
+
+    daemon = sub.add_parser("daemon", help="run the warm daemon with a local control socket")
+    daemon.add_argument("--socket", help="control socket path (default: runtime.daemon_socket)")
+    daemon.add_argument("--no-schedule", action="store_true", help="serve commands only; no background cycles")
+    daemon.set_defaults(func=cmd_daemon)
+
+    ctl = sub.add_parser("ctl", help="send a command to a running daemon (cycle | verify <id> | status | reload)")
+    ctl.add_argument("control", nargs="+", help="command and arguments")
+    ctl.add_argument("--socket", help="control socket path (default: runtime.daemon_socket)")
+    ctl.set_defaults(func=cmd_ctl)
+
+    backfill = sub.add_parser("backfill", help="commit backfilled posts/variants through git fast-import")
+    backfill.add_argument("backfill", nargs=argparse.REMAINDER, help="paths and options for the backfill CLI")
+    backfill.set_defaults(func=cmd_backfill)
+
+    blobs = sub.add_parser("blobs", help="deduplicate asset binaries into the blob store (scan | dedupe | materialize)")
+    blobs.add_argument("action", nargs=argparse.REMAINDER, help="arguments for the blob store CLI")
+    blobs.set_defaults(func=cmd_blobs)
+
+    history = sub.add_parser("history", help="query the cycle history store")
+    history.add_argument("query", nargs=argparse.REMAINDER, help="arguments for the history query CLI")
+    history.set_defaults(func=cmd_history)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
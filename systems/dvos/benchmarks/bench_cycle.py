@@ -0,0 +1,278 @@
+# DVOS Benchmarks — Cycle Stage Timing
+# Times each DVOS stage and the full scheduler cycle against a synthetic root
+# Each run executes in a forked child so peak RSS and syscall counts are per stage
+# Every run gets a fresh copy of the synthetic root, so all repeats are cold and do the
+# same work (no warm validation cache, no mismatches healed by an earlier run)
+# Emits JSON so results can be diffed between commits on a plain Linux box
+#
+# Usage (from the repo root):
+#   python systems/dvos/benchmarks/bench_cycle.py --descriptors 5000 --posts 500 --output bench.json
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+DVOS_PATH = os.path.join(REPO_ROOT, "systems", "dvos")
+for path in (DVOS_PATH, REPO_ROOT, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from synthetic_tree import build_synthetic_root  # noqa: E402
+
+
+# --- Stage Definitions -----------------------------------------------------
+
+def stage_run_analysis():
+    from engine.analyzer import run_analysis
+    return len(run_analysis().get("assets", []))
+
+
+def stage_check_assets():
+    from engine.integrity_verifier import check_assets, load_merged_map
+    merged = load_merged_map()
+    issues = check_assets(merged, ".", "systems/dvos/runtime/logs/asset-sync.log")
+    return sum(len(v) for v in issues.values())
+
+
+def stage_load_visual_profile():
+    from engine.visual_profile_manager import load_visual_profile
+    return len(load_visual_profile().get("ui_elements", []))
+
+
+def stage_detect_asset_mismatches():
+    from engine.dvos_cycle import detect_asset_mismatches
+    report = detect_asset_mismatches()
+    return len(report["missing_json"]) + len(report["missing_binary"])
+
+
+def stage_generate_content(count):
+    from engine.generate_content import NICHES, generate_article
+    return sum(len(generate_article(NICHES[i % len(NICHES)])) for i in range(count))
+
+
+def stage_run_dvos_cycle():
+    from dvos_scheduler import run_dvos_cycle
+    return run_dvos_cycle().get("assets", 0)
+
+
+def setup_merged_map():
+    """Untimed prerequisite for stages that read the analyzer's merged map."""
+    from engine.analyzer import run_analysis
+    run_analysis()
+
+
+# (name, stage, args, untimed setup run in the same child before the clock starts)
+STAGES = [
+    ("run_analysis", stage_run_analysis, (), None),
+    ("check_assets", stage_check_assets, (), setup_merged_map),
+    ("load_visual_profile", stage_load_visual_profile, (), None),
+    ("detect_asset_mismatches", stage_detect_asset_mismatches, (), None),
+    ("generate_content", stage_generate_content, None, None),  # args filled from --posts
+    ("run_dvos_cycle", stage_run_dvos_cycle, (), None),
+]
+
+
+# --- Tree Sanity Check -----------------------------------------------------
+
+def count_missing_files():
+    """Analyze the root and return how many descriptor paths the verifier cannot find."""
+    from engine.analyzer import run_analysis
+    from engine.integrity_verifier import check_assets, load_merged_map
+    run_analysis()
+    return len(check_assets(load_merged_map(), ".", "systems/dvos/runtime/logs/asset-sync.log")["missing_files"])
+
+
+def check_tree(root, tree):
+    """Fail before timing when descriptors point at paths the synthetic tree never wrote.
+
+    Only descriptors left without a binary (plus or minus corrupted ones) may be reported
+    missing; anything else means the stages would be timed against a broken tree.
+    """
+    result = measure_stage(count_missing_files, (), fresh_copy(root))
+    if result["error"]:
+        raise RuntimeError(f"Synthetic tree check failed: {result['error']}")
+    expected = tree["descriptors"] - tree["binaries"]
+    if not expected - tree["corrupt"] <= result["value"] <= expected:
+        raise RuntimeError(
+            f"Synthetic tree check failed: {result['value']} missing files reported, expected {expected} "
+            f"({tree['corrupt']} corrupt descriptors) — descriptor paths do not match the tree."
+        )
+    return result["value"]
+
+
+# --- Measurement -----------------------------------------------------------
+
+def read_proc_io():
+    """Return read/write syscall counters from /proc/self/io (None off Linux)."""
+    try:
+        with open("/proc/self/io", "r") as f:
+            fields = dict(line.split(":", 1) for line in f)
+        return int(fields["syscr"]), int(fields["syscw"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def fresh_copy(template):
+    """Copy the pristine synthetic root next to it and return the copy's path."""
+    root = tempfile.mkdtemp(prefix="run-", dir=os.path.dirname(template))
+    shutil.copytree(template, root, dirs_exist_ok=True)
+    return root
+
+
+def _measure_child(func, args, root, conn, setup=None):
+    """Child body: run one stage inside the synthetic root and report measurements."""
+    os.chdir(root)
+    result = {"error": None}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if setup is not None:
+            try:
+                setup()
+            except Exception as e:
+                result["error"] = f"setup {type(e).__name__}: {e}"
+        reads_before, writes_before = read_proc_io()
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        try:
+            result["value"] = func(*args)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["wall_s"] = time.perf_counter() - start
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        reads_after, writes_after = read_proc_io()
+
+    result["peak_rss_kb"] = usage.ru_maxrss
+    result["cpu_s"] = (usage.ru_utime - usage_before.ru_utime) + (usage.ru_stime - usage_before.ru_stime)
+    result["ctx_switches"] = (usage.ru_nvcsw - usage_before.ru_nvcsw) + (usage.ru_nivcsw - usage_before.ru_nivcsw)
+    if reads_before is not None:
+        result["read_syscalls"] = reads_after - reads_before
+        result["write_syscalls"] = writes_after - writes_before
+    conn.send(result)
+    conn.close()
+
+
+def measure_stage(func, args, root, setup=None):
+    """Run a stage in a forked child and collect its measurements; `root` is removed afterwards."""
+    ctx = multiprocessing.get_context("fork")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure_child, args=(func, args, root, child_conn, setup))
+    proc.start()
+    child_conn.close()
+    result = parent_conn.recv()
+    proc.join()
+    shutil.rmtree(root, ignore_errors=True)
+    return result
+
+
+def summarize_runs(runs):
+    """Collapse repeated runs into median/min/max wall time plus worst-case resources."""
+    walls = [r["wall_s"] for r in runs]
+    summary = {
+        "wall_s_median": round(statistics.median(walls), 6),
+        "wall_s_min": round(min(walls), 6),
+        "wall_s_max": round(max(walls), 6),
+        "cpu_s_median": round(statistics.median(r["cpu_s"] for r in runs), 6),
+        "peak_rss_kb": max(r["peak_rss_kb"] for r in runs),
+        "ctx_switches": max(r["ctx_switches"] for r in runs),
+        "result": runs[-1].get("value"),
+        "errors": sorted({r["error"] for r in runs if r["error"]}),
+    }
+    if "read_syscalls" in runs[-1]:
+        summary["read_syscalls"] = max(r["read_syscalls"] for r in runs)
+        summary["write_syscalls"] = max(r["write_syscalls"] for r in runs)
+    return summary
+
+
+def git_revision():
+    """Return the current commit hash of the repo under test, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def run_benchmarks(descriptors=1000, binaries=1000, posts=100, corrupt_ratio=0.0,
+                   missing_ratio=0.0, repeat=3, stages=None, seed=0, keep_root=False):
+    """Build a synthetic root, time every stage `repeat` times and return a JSON-able report.
+
+    The root is built once under <workdir>/template and copied for every run.
+    """
+    workdir = tempfile.mkdtemp(prefix="dvos-bench-")
+    root = os.path.join(workdir, "template")
+    try:
+        tree = build_synthetic_root(
+            root, descriptors, binaries, posts, corrupt_ratio, missing_ratio, seed=seed
+        )
+        tree["missing_files"] = check_tree(root, tree)
+        results = {}
+        for name, func, args, setup in STAGES:
+            if stages and name not in stages:
+                continue
+            args = (posts,) if args is None else args
+            runs = [measure_stage(func, args, fresh_copy(root), setup) for _ in range(repeat)]
+            results[name] = summarize_runs(runs)
+        return {
+            "meta": {
+                "revision": git_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "params": {
+                    "descriptors": descriptors, "binaries": binaries, "posts": posts,
+                    "corrupt_ratio": corrupt_ratio, "missing_ratio": missing_ratio,
+                    "repeat": repeat, "seed": seed,
+                },
+                "tree": tree,
+                "root": root if keep_root else None,
+            },
+            "stages": results,
+        }
+    finally:
+        if not keep_root:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DVOS cycle stages on a synthetic asset tree.")
+    parser.add_argument("--descriptors", type=int, default=1000, help="number of .json descriptors (N)")
+    parser.add_argument("--binaries", type=int, default=1000, help="number of binary assets (M)")
+    parser.add_argument("--posts", type=int, default=100, help="number of posts (K)")
+    parser.add_argument("--corrupt-ratio", type=float, default=0.0, help="fraction of corrupted descriptors")
+    parser.add_argument("--missing-ratio", type=float, default=0.0, help="fraction of binaries left missing")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    parser.add_argument("--stage", action="append", help="only run the named stage (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep-root", action="store_true", help="keep the synthetic root for inspection")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.descriptors, args.binaries, args.posts, args.corrupt_ratio,
+        args.missing_ratio, args.repeat, args.stage, args.seed, args.keep_root,
+    )
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+        print(f"[BENCH] Results written to {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# DVOS Benchmarks — CLI Cold Start / Import Time
+# Launches `python -X importtime -m systems.dvos <command>` against a synthetic root
+# and reports wall time, total import time and module count per subcommand
+#
+# Usage (from the repo root):
+#   python systems/dvos/benchmarks/bench_imports.py --repeat 5 --output imports.json
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_tree import build_synthetic_root  # noqa: E402
+
+# `schedule` loops forever, so only its argument parsing is measured
+COMMANDS = [
+    ["--help"],
+    ["analyze"],
+    ["verify"],
+    ["heal", "--dry-run"],
+    ["generate"],
+    ["cycle"],
+    ["schedule", "--help"],
+]
+
+
+def parse_importtime(stderr):
+    """Sum self-time (µs) and count modules from -X importtime output."""
+    total_us = 0
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            total_us += int(line.split(":", 1)[1].split("|")[0])
+            modules += 1
+        except ValueError:
+            continue
+    return total_us, modules
+
+
+def time_command(args, root):
+    """Run one CLI invocation in a fresh interpreter and measure it."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "systems.dvos", *args],
+        cwd=root, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    import_us, modules = parse_importtime(proc.stderr)
+    return {"wall_s": wall, "import_s": import_us / 1e6, "modules": modules, "returncode": proc.returncode}
+
+
+def baseline(root):
+    """Interpreter start-up cost with no DVOS imports, for comparison."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=root, check=True)
+    return time.perf_counter() - start
+
+
+def run_import_benchmarks(repeat=5, descriptors=200):
+    """Measure every subcommand `repeat` times and return a JSON-able report."""
+    root = tempfile.mkdtemp(prefix="dvos-imports-")
+    try:
+        build_synthetic_root(root, descriptors=descriptors, binaries=descriptors, posts=10)
+        results = {"python -c pass": {"wall_s_median": round(statistics.median(baseline(root) for _ in range(repeat)), 6)}}
+        for args in COMMANDS:
+            runs = [time_command(args, root) for _ in range(repeat)]
+            results[" ".join(args)] = {
+                "wall_s_median": round(statistics.median(r["wall_s"] for r in runs), 6),
+                "import_s_median": round(statistics.median(r["import_s"] for r in runs), 6),
+                "modules": runs[-1]["modules"],
+                "returncodes": sorted({r["returncode"] for r in runs}),
+            }
+        return {"python": sys.version.split()[0], "repeat": repeat, "commands": results}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DVOS CLI cold-start import cost.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--descriptors", type=int, default=200)
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    payload = json.dumps(run_import_benchmarks(args.repeat, args.descriptors), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+        print(f"[BENCH] Results written to {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
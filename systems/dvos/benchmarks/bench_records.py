@@ -0,0 +1,95 @@
+# DVOS Benchmarks — Asset Record Memory Footprint
+# Compares plain descriptor dicts with engine.asset_records.AssetRecord for N assets
+# Descriptors are parsed from JSON one by one, as the analyzer does, so every dict
+# owns its own copies of repeated strings; memory is measured with tracemalloc
+#
+# Usage (from the repo root):
+#   python systems/dvos/benchmarks/bench_records.py --assets 100000 --output records.json
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+DVOS_PATH = os.path.join(REPO_ROOT, "systems", "dvos")
+for path in (DVOS_PATH, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from engine.asset_records import AssetRecord, dump_merged_map  # noqa: E402
+from synthetic_tree import CATEGORIES, SCHEMA_EXAMPLE  # noqa: E402
+
+
+def synthetic_descriptors(count):
+    """Serialized descriptors shaped like the synthetic tree's (one JSON string each)."""
+    folders = list(CATEGORIES)
+    raw = []
+    for i in range(count):
+        folder = folders[i % len(folders)]
+        category, ext = CATEGORIES[folder]
+        asset_id = f"asset-{i:06d}"
+        raw.append(json.dumps(dict(SCHEMA_EXAMPLE, id=asset_id, category=category,
+                                   path=f"assets/{folder}/{asset_id}.{ext}")))
+    return raw
+
+
+def measure(raw, build):
+    """Build the catalog from raw JSON and return (bytes held, seconds, catalog)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = [build(json.loads(item)) for item in raw]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, elapsed, catalog
+
+
+def serialize(assets):
+    """Merged-map JSON for `assets`, fixed timestamp so outputs are comparable."""
+    class Buffer(list):
+        write = list.append
+
+    out = Buffer()
+    dump_merged_map({"assets": assets, "generated_at": "1970-01-01T00:00:00Z", "status": "ok"}, out)
+    return "".join(out)
+
+
+def run_record_benchmark(count=100000):
+    """Measure dict vs AssetRecord catalogs and confirm the JSON round trip is lossless."""
+    raw = synthetic_descriptors(count)
+    dict_bytes, dict_s, dicts = measure(raw, lambda d: d)
+    record_bytes, record_s, records = measure(raw, AssetRecord)
+
+    lossless = serialize(dicts) == serialize(records) and all(r.to_dict() == d for r, d in zip(records, dicts))
+    return {
+        "python": sys.version.split()[0],
+        "assets": count,
+        "dict": {"bytes": dict_bytes, "bytes_per_asset": round(dict_bytes / count, 1), "build_s": round(dict_s, 4)},
+        "record": {"bytes": record_bytes, "bytes_per_asset": round(record_bytes / count, 1), "build_s": round(record_s, 4)},
+        "reduction": round(1 - record_bytes / dict_bytes, 3) if dict_bytes else None,
+        "lossless_round_trip": lossless,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DVOS asset record memory against plain dicts.")
+    parser.add_argument("--assets", type=int, default=100000)
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    payload = json.dumps(run_record_benchmark(args.assets), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+        print(f"[BENCH] Results written to {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
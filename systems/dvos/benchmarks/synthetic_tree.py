@@ -0,0 +1,110 @@
+# DVOS Benchmarks — Synthetic Asset Tree Generator
+# Builds a throwaway repo-shaped root (registry, schema, descriptors, binaries, posts)
+# with configurable size plus corruption and missing-file ratios
+
+import json
+import os
+import random
+
+DVOS_DIR = "systems/dvos"
+CATEGORIES = {
+    "ui": ("ui", "svg"),
+    "backgrounds": ("layout", "jpg"),
+    "logo": ("branding", "png"),
+    "posts": ("media", "jpg"),
+}
+
+STUB_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="240" height="64"><rect width="240" height="64"/></svg>\n'
+
+SCHEMA_EXAMPLE = {
+    "id": "example",
+    "path": "assets/ui/example.svg",
+    "category": "ui",
+    "style": "energetic-creator",
+    "version": "1.0",
+    "auto_optimize": True,
+    "web_optimized": True,
+    "description": "Synthetic schema example.",
+    "last_updated": "2025-11-08",
+}
+
+
+def _write(path, content, mode="w"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode) as f:
+        f.write(content)
+
+
+def write_registry(root, categories):
+    """Write a registry with commits/webhooks disabled so cycles stay local."""
+    registry = {
+        "project": "DVOS Benchmark",
+        "system": "DVOS",
+        "visual_profile": "energetic-creator",
+        "version": "1.6",
+        "asset_sources": [f"{DVOS_DIR}/assets/{c}" for c in categories],
+        "runtime": {
+            # Relative to the DVOS root, as in the shipped registry
+            "compiled_output": "runtime/merged-asset-map.json",
+            "validation_schema": "schema/asset-map.json",
+            "log_path": "runtime/logs/asset-sync.log",
+            "auto_heal": True,
+            "auto_cycle_interval": "5m",
+        },
+        "optimization": {"webp": False, "workers": 1},
+        "notifications": {"webhook_url": []},
+        "repo": {"auto_commit": False},
+        "metadata": {"auto_validation": True, "theme_alignment": "dark", "optimization_level": "full"},
+    }
+    _write(os.path.join(root, DVOS_DIR, "schema", "registry.json"), json.dumps(registry, indent=2))
+    _write(
+        os.path.join(root, DVOS_DIR, "schema", "asset-map.json"),
+        json.dumps({"assets": [SCHEMA_EXAMPLE]}, indent=2),
+    )
+
+
+def build_synthetic_root(root, descriptors=1000, binaries=1000, posts=100,
+                         corrupt_ratio=0.0, missing_ratio=0.0, binary_size=4096, seed=0):
+    """Populate `root` with N descriptors, up to M binaries and K posts; return a summary."""
+    rng = random.Random(seed)
+    names = list(CATEGORIES)
+    write_registry(root, names)
+
+    stats = {"descriptors": 0, "corrupt": 0, "binaries": 0, "missing": 0, "posts": 0}
+    for i in range(descriptors):
+        folder = names[i % len(names)]
+        category, ext = CATEGORIES[folder]
+        asset_id = f"asset-{i:06d}"
+        base = os.path.join(root, DVOS_DIR, "assets", folder, asset_id)
+        descriptor = dict(SCHEMA_EXAMPLE, id=asset_id, category=category,
+                          path=f"assets/{folder}/{asset_id}.{ext}")
+
+        if rng.random() < corrupt_ratio:
+            # Alternate between unparseable JSON and a schema violation
+            content = json.dumps(descriptor)[:-7] if i % 2 else json.dumps(dict(descriptor, version=1))
+            stats["corrupt"] += 1
+        else:
+            content = json.dumps(descriptor, indent=2)
+        _write(base + ".json", content)
+        stats["descriptors"] += 1
+
+        if i < binaries:
+            if rng.random() < missing_ratio:
+                stats["missing"] += 1
+            elif ext == "svg":
+                _write(f"{base}.{ext}", STUB_SVG)
+                stats["binaries"] += 1
+            else:
+                _write(f"{base}.{ext}", rng.randbytes(binary_size), mode="wb")
+                stats["binaries"] += 1
+
+    for i in range(posts):
+        day = f"2025-{(i // 28) % 12 + 1:02d}-{i % 28 + 1:02d}"
+        _write(
+            os.path.join(root, "_posts", f"{day}-synthetic-post-{i:06d}.md"),
+            f'---\nlayout: post\ntitle: "Synthetic Post {i}"\ndate: {day} 12:00:00\n---\n\nBody {i}.\n',
+        )
+        stats["posts"] += 1
+
+    os.makedirs(os.path.join(root, DVOS_DIR, "runtime", "logs"), exist_ok=True)
+    return stats
@@ -0,0 +1,251 @@
+# DVOS Daemon — Warm Runtime with Local Control Socket
+# Keeps the registry snapshot, asset catalog, validator and visual context warm in memory
+# Runs scheduler cycles in the background and answers control commands over a Unix socket:
+#   cycle | verify <asset-id> | status | reload
+#
+# Start:   python -m systems.dvos daemon
+# Control: python -m systems.dvos ctl status      (or: echo status | nc -U systems/dvos/runtime/dvos.sock)
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime
+
+from systems.dvos.engine.registry_loader import DVOSRegistry
+
+DEFAULT_SOCKET_PATH = "systems/dvos/runtime/dvos.sock"
+MERGED_MAP_PATH = "systems/dvos/runtime/merged-asset-map.json"
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+
+
+def log_daemon(message):
+    """Append daemon events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [DAEMON] {message}\n")
+
+
+def socket_path():
+    """Return the control socket path configured in the registry."""
+    return DVOSRegistry.get_runtime().get("daemon_socket", DEFAULT_SOCKET_PATH)
+
+
+# --- Warm State ------------------------------------------------------------
+
+class DaemonState:
+    """In-memory runtime state shared by the scheduler thread and socket handlers."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.cycle_lock = threading.Lock()
+        self.state_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.cycles_run = 0
+        self.last_cycle = None
+        self.next_cycle_at = None
+        self.registry = {}
+        self.catalog = {}
+        self.visual_context = {}
+        self.reload()
+
+    def reload(self):
+        """Re-read the registry and rebuild the catalog and visual context."""
+        from engine.schema_validator import reset_validators
+        from engine.visual_profile_manager import load_visual_profile
+
+        registry = DVOSRegistry.load(force_reload=True)
+        reset_validators()
+        visual_context = load_visual_profile()
+        with self.state_lock:
+            self.registry = registry
+            self.visual_context = visual_context
+        self.refresh_catalog()
+        log_daemon(f"State loaded — {len(self.catalog)} assets in catalog.")
+
+    def refresh_catalog(self):
+        """Index the merged asset map by id as compact AssetRecords (after each cycle or on reload)."""
+        from engine.asset_records import load_merged_records
+
+        catalog = {}
+        if os.path.exists(MERGED_MAP_PATH):
+            for asset in load_merged_records(MERGED_MAP_PATH).get("assets", []):
+                if asset.get("id"):
+                    catalog[asset["id"]] = asset
+        with self.state_lock:
+            self.catalog = catalog
+
+    def run_cycle(self):
+        """Run one scheduler cycle (serialized) and refresh warm state from its output."""
+        from dvos_scheduler import run_dvos_cycle
+
+        with self.cycle_lock:
+            result = run_dvos_cycle()
+            self.refresh_catalog()
+            with self.state_lock:
+                self.cycles_run += 1
+                self.last_cycle = result
+        return result
+
+    def verify_asset(self, asset_id):
+        """Check one catalog entry against the schema and the filesystem."""
+        from engine.schema_validator import get_validator
+
+        with self.state_lock:
+            asset = self.catalog.get(asset_id)
+            runtime = self.registry.get("runtime", {})
+        if asset is None:
+            return {"id": asset_id, "found": False}
+        path = asset.get("path", "")
+        candidates = [path, os.path.join("systems/dvos", path)]
+        schema_errors = get_validator(runtime.get("validation_schema", "schema/asset-map.json")).check(asset.to_dict())
+        return {
+            "id": asset_id,
+            "found": True,
+            "path": path,
+            "exists": any(os.path.exists(p) for p in candidates),
+            "schema_errors": schema_errors,
+        }
+
+    def status(self):
+        """Summarize daemon health, warm state and recent cycle metrics."""
+        from engine import metrics
+
+        with self.state_lock:
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "cycles_run": self.cycles_run,
+                "cycle_running": self.cycle_lock.locked(),
+                "next_cycle_in_s": round(max(self.next_cycle_at - time.time(), 0), 1) if self.next_cycle_at else None,
+                "registry_version": self.registry.get("version"),
+                "visual_profile": self.visual_context.get("profile"),
+                "catalog_size": len(self.catalog),
+                "last_cycle": self.last_cycle,
+                "recent_cycles": metrics.recent_cycles()[-5:],
+            }
+
+
+# --- Command Dispatch ------------------------------------------------------
+
+def dispatch(state, line):
+    """Execute one control command line and return a JSON-able response."""
+    parts = line.strip().split()
+    if not parts:
+        return {"ok": False, "error": "empty command"}
+    command, args = parts[0].lower(), parts[1:]
+    try:
+        if command == "status":
+            return {"ok": True, "status": state.status()}
+        if command == "cycle":
+            return {"ok": True, "cycle": state.run_cycle()}
+        if command == "verify":
+            if not args:
+                return {"ok": False, "error": "usage: verify <asset-id>"}
+            return {"ok": True, "assets": [state.verify_asset(a) for a in args]}
+        if command == "reload":
+            state.reload()
+            state.wake.set()  # re-read the interval immediately
+            return {"ok": True, "catalog_size": len(state.catalog)}
+        return {"ok": False, "error": f"unknown command '{command}'"}
+    except Exception as e:
+        log_daemon(f"[ERROR] Command '{line.strip()}' failed: {e}")
+        return {"ok": False, "error": str(e)}
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    """Line-oriented handler: one command per line, one JSON response per line."""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8", "replace")
+            if not line.strip():
+                continue
+            response = dispatch(self.server.state, line)
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, state):
+        self.state = state
+        super().__init__(path, ControlHandler)
+
+
+# --- Scheduler Loop --------------------------------------------------------
+
+def scheduler_loop(state):
+    """Run cycles on the registry interval; `reload` or shutdown wakes the loop early."""
+    while not state.stopping.is_set():
+        start = time.time()
+        try:
+            state.run_cycle()
+        except Exception as e:
+            log_daemon(f"[ERROR] Background cycle failed: {e}")
+        interval = DVOSRegistry.get_cycle_interval()
+        remaining = max(interval - (time.time() - start), 5)
+        state.next_cycle_at = time.time() + remaining
+        state.wake.wait(remaining)
+        state.wake.clear()
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def run_daemon(path=None, schedule=True):
+    """Start the warm daemon: control socket in the foreground, cycles in the background."""
+    path = path or socket_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)  # stale socket from an unclean shutdown
+
+    state = DaemonState()
+    server = ControlServer(path, state)
+    os.chmod(path, 0o600)
+
+    def shutdown(signum, frame):
+        state.stopping.set()
+        state.wake.set()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    if schedule:
+        threading.Thread(target=scheduler_loop, args=(state,), daemon=True, name="dvos-scheduler").start()
+
+    log_daemon(f"Daemon listening on {path}.")
+    print(f"[DVOS Daemon] Listening on {path}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+        log_daemon("Daemon stopped.")
+        print("🟥 DVOS Daemon stopped.")
+
+
+def send_command(command, path=None, timeout=600):
+    """Send one command to a running daemon and return its decoded response."""
+    path = path or socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall((command.strip() + "\n").encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data.decode("utf-8"))
+
+
+if __name__ == "__main__":
+    run_daemon()
@@ -7,13 +7,9 @@ import os
 from datetime import datetime
 from random import uniform
 
-# Core DVOS modules
+# Core DVOS modules — stage modules are imported inside run_dvos_cycle so that
+# importing the scheduler (e.g. for `python -m systems.dvos schedule --help`) stays cheap
 from systems.dvos.engine.registry_loader import DVOSRegistry
-from engine.analyzer import run_analysis
-from engine.integrity_verifier import verify_assets
-from engine.auto_healer import heal_assets
-from engine.dvos_auto_commit import git_commit_and_push, send_webhook_notification
-from engine.visual_profile_manager import apply_visual_context   # ✅ NEW
 
 LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
 
@@ -45,14 +41,30 @@ def exponential_backoff_retry(func, max_retries=3, base_delay=3, *args, **kwargs
 
 def run_dvos_cycle():
     """Run one full analysis → verification → healing → commit → notify cycle."""
+    from engine.analyzer import run_analysis
+    from engine.integrity_verifier import verify_assets
+    from engine.auto_healer import heal_assets
+    from engine.dvos_cycle import detect_asset_mismatches
+    from engine.mismatch_scanner import save_state as save_mismatch_state
+    from engine.dvos_auto_commit import git_commit_and_push, send_webhook_notification
+    from engine.visual_profile_manager import apply_visual_context
+    from engine.image_optimizer import run_optimizer
+    from engine.responsive_images import run_responsive_images
+    from engine import metrics
+    from engine.cycle_history import record_cycle
+    from engine.blob_store import materialize
+
     start_time = time.time()
     registry = DVOSRegistry.load()
     log_cycle("Starting DVOS cycle.")
     print("\n🚀 [DVOS] Initiating full system cycle...")
 
+    verification = None
+    heal_actions = []
     cycle_data = {
         "assets": 0,
         "healed": 0,
+        "optimized": 0,
         "status": "ok",
         "duration": "0s",
         "commit": False
@@ -60,42 +72,81 @@ def run_dvos_cycle():
 
     try:
         # Step 0 — Apply visual context (themes, presets, metadata)
-        apply_visual_context()
+        with metrics.stage("visual"):
+            apply_visual_context()
         log_cycle("Visual profile context applied.")
         print("🎨 Visual context loaded from registry and presets.")
 
         # Step 1 — Analyze
-        result = run_analysis()
+        with metrics.stage("analysis"):
+            result = run_analysis()
         asset_count = len(result.get("assets", []))
         cycle_data["assets"] = asset_count
         log_cycle(f"Analyzer complete: {asset_count} assets found.")
 
-        # Step 2 — Verify
-        mismatches = verify_assets()
-        if mismatches["status"] == "ok":
+        # Step 1b — Restore deduplicated paths deleted from the tree (no-op without a blob manifest)
+        with metrics.stage("materialize"):
+            restored = materialize()
+        if restored:
+            log_cycle(f"Blob store restored {restored} missing paths.")
+
+        # Step 2 — Verify (integrity report) and detect descriptor/binary mismatches
+        with metrics.stage("verify"):
+            verification = verify_assets()
+            mismatches = detect_asset_mismatches()
+        new_mismatches = {
+            "missing_json": mismatches["new_missing_json"],
+            "missing_binary": mismatches["new_missing_binary"],
+        }
+        if verification["status"] == "ok" and not any(new_mismatches.values()):
+            save_mismatch_state(mismatches)
             log_cycle("Integrity verified — all assets synchronized.")
             print("✅ No mismatches detected.")
         else:
+            if verification["status"] != "ok":
+                cycle_data["status"] = "issues"
             runtime_config = DVOSRegistry.get_runtime()
             auto_heal_enabled = runtime_config.get("auto_heal", True)
-            if auto_heal_enabled:
-                log_cycle("Integrity issues found — initiating healing process.")
+            if not any(new_mismatches.values()):
+                log_cycle("Integrity issues found — no new mismatches to heal.")
+            elif auto_heal_enabled:
+                log_cycle("Mismatches found — initiating healing process.")
                 print("⚠️ Mismatches found, running auto-healer...")
-                repairs = heal_assets(mismatches)
+                with metrics.stage("heal"):
+                    repairs = heal_assets(new_mismatches, applied=heal_actions, strict=True)
+                # Only mark mismatches as seen once they were handed to the healer
+                save_mismatch_state(mismatches)
                 cycle_data["healed"] = repairs
                 cycle_data["status"] = "healed" if repairs else "issues"
                 log_cycle(f"Auto-healer applied {repairs} repairs.")
             else:
-                log_cycle("Integrity issues detected, but auto-heal is disabled.")
+                log_cycle("Mismatches detected, but auto-heal is disabled.")
                 cycle_data["status"] = "issues"
 
+        # Step 2b — Optimize raster assets for web delivery
+        with metrics.stage("optimize"):
+            optimization = run_optimizer()
+        cycle_data["optimized"] = optimization["processed"]
+        if not optimization["skipped"]:
+            log_cycle(
+                f"Image optimizer: {optimization['processed']} processed, "
+                f"{optimization['cached']} cached, {optimization['failed']} failed."
+            )
+            with metrics.stage("responsive"):
+                responsive = run_responsive_images()
+            log_cycle(f"Responsive images: {responsive['built']} derivatives rebuilt.")
+
         # Step 3 — Auto Commit (with retry logic)
         repo_config = DVOSRegistry.get_repo_config()
-        commit_prefix = repo_config.get("commit_prefix", "[DVOS]")
-        commit_msg = f"{commit_prefix} Automated cycle — {asset_count} assets processed"
-        commit_status = exponential_backoff_retry(git_commit_and_push, 3, 4, commit_msg)
-        cycle_data["commit"] = commit_status
-        log_cycle(f"Auto-commit {'successful' if commit_status else 'failed after retries'}.")
+        if repo_config.get("auto_commit", False):
+            commit_prefix = repo_config.get("commit_prefix", "[DVOS]")
+            commit_msg = f"{commit_prefix} Automated cycle — {asset_count} assets processed"
+            with metrics.stage("commit"):
+                commit_status = exponential_backoff_retry(git_commit_and_push, 3, 4, commit_msg)
+            cycle_data["commit"] = commit_status
+            log_cycle(f"Auto-commit {'successful' if commit_status else 'failed after retries'}.")
+        else:
+            log_cycle("Auto-commit disabled in registry — skipping commit step.")
 
     except Exception as e:
         log_cycle(f"[CRITICAL] DVOS cycle failure: {e}")
@@ -107,12 +158,28 @@ def run_dvos_cycle():
         f"**DVOS Cycle Summary**\n"
         f"- Assets Processed: {cycle_data['assets']}\n"
         f"- Healed: {cycle_data['healed']}\n"
+        f"- Optimized: {cycle_data['optimized']}\n"
         f"- Duration: {cycle_data['duration']}\n"
         f"- Commit: {'✅ Success' if cycle_data['commit'] else '❌ Failed'}\n"
         f"- Status: {cycle_data['status'].upper()}"
     )
 
-    exponential_backoff_retry(send_webhook_notification, 3, 5, summary, cycle_data)
+    if DVOSRegistry.get_notifications().get("webhook_url"):
+        with metrics.stage("notify"):
+            exponential_backoff_retry(send_webhook_notification, 3, 5, summary, cycle_data)
+
+    # Export per-stage metrics (Prometheus textfile + in-memory ring buffer)
+    snapshot = metrics.end_cycle(cycle_data["status"], time.time() - start_time)
+    cycle_data["stages"] = snapshot["stages"]
+
+    # Persist the cycle to the queryable history store (one batched transaction)
+    try:
+        record_cycle(
+            cycle_data, start_time, snapshot["stages"], verification, heal_actions,
+            DVOSRegistry.get_runtime().get("history_db", "systems/dvos/runtime/cycle-history.db")
+        )
+    except Exception as e:
+        log_cycle(f"[WARN] Could not record cycle history: {e}")
 
     log_cycle("Cycle complete.")
     print("🟢 [DVOS] Cycle complete.\n")
@@ -7,6 +7,13 @@ import json
 import os
 from datetime import datetime
 
+from engine import metrics
+from engine.asset_records import AssetRecord, dump_merged_map
+from engine.registry_loader import DVOSRegistry
+from engine.schema_validator import format_errors, get_validator
+
+DVOS_ROOT = "systems/dvos"
+
 # --- Shared Utility --------------------------------------------------------
 
 def log_event(message, log_path="systems/dvos/runtime/logs/asset-sync.log"):
@@ -17,13 +24,25 @@ def log_event(message, log_path="systems/dvos/runtime/logs/asset-sync.log"):
 
 # --- Core Functions --------------------------------------------------------
 
-def load_registry(path="schema/registry.json"):
-    """Load the DVOS registry file."""
+def load_registry(path=None):
+    """Load the DVOS registry (systems/dvos/schema/registry.json unless `path` is given)."""
+    if path is None:
+        return DVOSRegistry.load()
     with open(path, "r") as f:
         return json.load(f)
 
-def scan_asset_sources(sources, log_path=None):
-    """Iterate through asset directories and collect .json descriptors."""
+def resolve_runtime_path(path):
+    """Resolve a registry path given relative to the DVOS root (e.g. runtime/...) from the repo root."""
+    if os.path.isabs(path) or path.replace("\\", "/").startswith(DVOS_ROOT + "/"):
+        return path
+    return os.path.join(DVOS_ROOT, path)
+
+def scan_asset_sources(sources, log_path=None, validator=None, rejected=None):
+    """Iterate through asset directories and collect .json descriptors as AssetRecords.
+
+    With a validator, each descriptor is checked as it is parsed; failures are
+    appended to `rejected` (file + per-field errors) instead of being merged.
+    """
     assets = []
     for folder in sources:
         if not os.path.exists(folder):
@@ -34,10 +53,23 @@ def scan_asset_sources(sources, log_path=None):
         for root, _, files in os.walk(folder):
             for file in files:
                 if file.endswith(".json") and "asset-map" not in file:
+                    file_path = os.path.join(root, file)
                     try:
-                        with open(os.path.join(root, file), "r") as f:
-                            asset_data = json.load(f)
-                            assets.append(asset_data)
+                        with open(file_path, "rb") as f:
+                            raw = f.read()
+                        metrics.inc("dvos_files_scanned")
+                        metrics.inc("dvos_bytes_read", len(raw))
+                        asset_data = json.loads(raw)
+                        if validator is not None:
+                            errors = validator.validate(raw, asset_data)
+                            if errors:
+                                msg = f"[SCHEMA] Rejected {file_path}: {format_errors(errors)}"
+                                print(msg)
+                                log_event(msg, log_path)
+                                if rejected is not None:
+                                    rejected.append({"file": file_path, "errors": errors})
+                                continue
+                        assets.append(AssetRecord(asset_data))
                     except Exception as e:
                         msg = f"[ERROR] Could not load {file}: {e}"
                         print(msg)
@@ -45,16 +77,20 @@ def scan_asset_sources(sources, log_path=None):
     log_event(f"Asset scan complete for {len(assets)} files.", log_path)
     return assets
 
-def write_merged_asset_map(assets, output_path, log_path=None):
+def write_merged_asset_map(assets, output_path, log_path=None, rejected=None):
     """Save all collected assets to the runtime merged asset map."""
     merged_data = {
         "assets": assets,
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "status": "ok" if assets else "empty"
     }
+    if rejected:
+        merged_data["rejected"] = rejected
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(merged_data, f, indent=2)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w") as f:
+        dump_merged_map(merged_data, f)
+    os.replace(tmp_path, output_path)
     msg = f"Merged asset map updated: {output_path} ({len(assets)} assets)"
     print(f"[DVOS] {msg}")
     log_event(msg, log_path)
@@ -68,12 +104,29 @@ def run_analysis():
     sources = registry.get("asset_sources", [])
     runtime = registry.get("runtime", {})
 
-    output_path = runtime.get("compiled_output", "systems/dvos/runtime/merged-asset-map.json")
-    log_path = runtime.get("log_path", "systems/dvos/runtime/logs/asset-sync.log")
+    output_path = resolve_runtime_path(runtime.get("compiled_output", "runtime/merged-asset-map.json"))
+    log_path = resolve_runtime_path(runtime.get("log_path", "runtime/logs/asset-sync.log"))
+
+    validator = None
+    if registry.get("metadata", {}).get("auto_validation", True):
+        schema_path = runtime.get("validation_schema", "schema/asset-map.json")
+        try:
+            validator = get_validator(schema_path)
+        except Exception as e:
+            log_event(f"[WARN] Schema validation disabled — could not compile {schema_path}: {e}", log_path)
 
     log_event("--- Analyzer execution started ---", log_path)
-    assets = scan_asset_sources(sources, log_path)
-    merged = write_merged_asset_map(assets, output_path, log_path)
+    rejected = []
+    hits, misses = (validator.hits, validator.misses) if validator else (0, 0)
+    assets = scan_asset_sources(sources, log_path, validator, rejected)
+    if validator is not None:
+        validator.save_cache()
+        log_event(
+            f"Schema validation: {len(rejected)} rejected "
+            f"({validator.hits - hits} cached, {validator.misses - misses} validated).",
+            log_path
+        )
+    merged = write_merged_asset_map(assets, output_path, log_path, rejected)
 
     log_event(f"Analyzer complete. {len(assets)} assets registered.", log_path)
     print(f"[DVOS] Asset analysis complete — {len(assets)} assets registered.")
@@ -0,0 +1,136 @@
+# DVOS Asset Records — Compact In-Memory Descriptors
+# One __slots__ object per descriptor instead of a dict; low-cardinality values
+# (category, style, version, ...) and key layouts are interned and shared
+# Records round-trip losslessly to the merged-asset-map JSON (same keys, order and types)
+
+import json
+import os
+import sys
+
+# Known descriptor fields get a slot; anything else lands in `extra`
+FIELDS = (
+    "id", "path", "category", "style", "version", "auto_optimize", "web_optimized",
+    "resolution_target", "description", "last_updated", "name", "theme", "priority",
+)
+# Values repeated across most descriptors — stored once per process
+INTERNED_FIELDS = frozenset({"category", "style", "version", "resolution_target", "theme"})
+
+_MISSING = object()
+_LAYOUTS = {}
+
+
+def _layout(keys):
+    """Return the shared, interned key-order tuple for a descriptor layout."""
+    keys = tuple(keys)
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        layout = _LAYOUTS[keys] = tuple(sys.intern(k) for k in keys)
+    return layout
+
+
+class AssetRecord:
+    """Read-mostly descriptor with dict-style access (get, [], in, keys, items)."""
+
+    __slots__ = FIELDS + ("_keys", "extra")
+
+    def __init__(self, data):
+        self._keys = _layout(data)
+        self.extra = None
+        for key, value in data.items():
+            self._store(key, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data)
+
+    def to_dict(self):
+        """Rebuild the original descriptor dict (key order preserved)."""
+        return {key: self[key] for key in self._keys}
+
+    # --- Mapping access ----------------------------------------------------
+
+    def _lookup(self, key):
+        if key in FIELDS:
+            return getattr(self, key, _MISSING)
+        if self.extra is not None:
+            return self.extra.get(key, _MISSING)
+        return _MISSING
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def _store(self, key, value):
+        if key in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        if key in FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __setitem__(self, key, value):
+        if key not in self._keys:
+            self._keys = _layout(self._keys + (key,))
+        self._store(key, value)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return self._keys
+
+    def items(self):
+        return [(key, self[key]) for key in self._keys]
+
+    def __eq__(self, other):
+        if isinstance(other, AssetRecord):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"AssetRecord({self.to_dict()!r})"
+
+
+# --- Merged Map I/O --------------------------------------------------------
+
+def to_records(assets):
+    """Convert descriptor dicts to records (non-dict entries are kept as-is)."""
+    return [AssetRecord(a) if isinstance(a, dict) else a for a in assets]
+
+
+def encode_record(obj):
+    """json.dump `default=` hook: serialize records one at a time, no full dict copy."""
+    if isinstance(obj, AssetRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_merged_records(path="systems/dvos/runtime/merged-asset-map.json"):
+    """Load a merged asset map with its assets held as AssetRecords."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Merged asset map not found at {path}")
+    with open(path, "r") as f:
+        merged = json.load(f)
+    merged["assets"] = to_records(merged.get("assets", []))
+    return merged
+
+
+def dump_merged_map(merged, f, indent=2):
+    """Write a merged map whose assets may be AssetRecords; output matches the dict form byte for byte."""
+    json.dump(merged, f, indent=indent, default=encode_record)
@@ -1,30 +1,56 @@
 # DVOS Auto-Healer — Full Self-Healing Version
 # Repairs missing asset descriptors and regenerates stub SVGs if needed.
+# Repairs are planned in memory first, then applied as one batch through
+# temp files + atomic renames so a failed run never leaves a half-healed tree.
 
 import os
 import json
+import tempfile
 from datetime import datetime
 
-def create_stub_svg(path):
-    """Generate a minimal valid SVG placeholder."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    svg_content = """<svg xmlns="http://www.w3.org/2000/svg" width="240" height="64">
+from engine import metrics
+from engine.integrity_verifier import check_assets, load_merged_map
+
+ASSET_ROOT = "systems/dvos/assets"
+DEFAULT_CATEGORY = "ui"
+BINARY_EXTENSIONS = {"svg", "png", "jpg", "jpeg", "webp", "gif"}
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+
+STUB_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="240" height="64">
   <rect width="240" height="64" fill="#1A1A1A" stroke="#FF00FF" stroke-width="2" rx="12" ry="12"/>
   <text x="50%" y="50%" fill="#FFFFFF" font-size="14" text-anchor="middle" dominant-baseline="middle">
     placeholder
   </text>
 </svg>
 """
-    with open(path, "w") as f:
-        f.write(svg_content)
 
 
-def create_placeholder_json(asset_id):
+def log_heal(message):
+    """Append healer events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [HEALER] {message}\n")
+
+
+def split_asset_key(asset):
+    """Split a mismatch key into (rel_dir, asset_id, ext).
+
+    Accepts path keys from the mismatch scanner ('backgrounds/grid-light.png')
+    as well as extensionless ('ui/button-primary') and legacy ('button-primary') keys.
+    """
+    rel_dir, name = os.path.split(asset.replace("\\", "/"))
+    asset_id, ext = os.path.splitext(name)
+    if ext[1:].lower() not in BINARY_EXTENSIONS:
+        asset_id, ext = name, ""
+    return rel_dir or DEFAULT_CATEGORY, asset_id, ext[1:].lower() or None
+
+
+def create_placeholder_json(asset_id, rel_dir=DEFAULT_CATEGORY, ext="svg"):
     """Generate a minimal descriptor for an asset."""
-    return {
+    descriptor = {
         "id": asset_id,
-        "path": f"assets/ui/{asset_id}.svg",
-        "category": "ui",
+        "path": f"assets/{rel_dir}/{asset_id}.{ext}",
+        "category": rel_dir.split("/")[0],
         "style": "auto-healed",
         "version": "1.0",
         "auto_optimize": True,
@@ -33,37 +59,143 @@ def create_placeholder_json(asset_id):
         "description": f"Auto-generated descriptor for recovered asset '{asset_id}'.",
         "last_updated": datetime.utcnow().isoformat() + "Z"
     }
+    if ext != "svg":
+        # Raster dimensions are unknown here; the optimizer keeps the source size
+        del descriptor["resolution_target"]
+    return descriptor
 
 
-def heal_assets(mismatches=None):
-    """Repair missing .json or .svg files based on mismatch data."""
-    repairs = 0
-    log_report = []
-
-    if mismatches:
-        # ✅ Heal missing JSON descriptors
-        for asset in mismatches.get("missing_json", []):
-            json_path = f"systems/dvos/assets/ui/{asset}.json"
-            os.makedirs(os.path.dirname(json_path), exist_ok=True)
-            if not os.path.exists(json_path):
-                with open(json_path, "w") as f:
-                    json.dump(create_placeholder_json(asset), f, indent=2)
-                repairs += 1
-                log_report.append(f"Created descriptor: {json_path}")
-
-        # ✅ Heal missing SVGs
-        for asset in mismatches.get("missing_svg", []):
-            svg_path = f"systems/dvos/assets/ui/{asset}.svg"
-            if not os.path.exists(svg_path):
-                create_stub_svg(svg_path)
-                repairs += 1
-                log_report.append(f"Created stub SVG: {svg_path}")
+# --- Planning --------------------------------------------------------------
 
+def plan_repairs(mismatches=None, asset_root=ASSET_ROOT):
+    """Build the in-memory list of repairs for a mismatch report without touching disk."""
+    plan = []
+    planned_paths = set()
     if not mismatches:
-        log_report.append("No mismatches detected.")
+        return plan
+
+    for asset in mismatches.get("missing_json", []):
+        rel_dir, asset_id, ext = split_asset_key(asset)
+        json_path = os.path.join(asset_root, rel_dir, f"{asset_id}.json")
+        if json_path in planned_paths or os.path.exists(json_path):
+            continue
+        planned_paths.add(json_path)
+        plan.append({
+            "action": "create_descriptor",
+            "asset": asset_id,
+            "path": json_path,
+            "content": json.dumps(create_placeholder_json(asset_id, rel_dir, ext or "svg"), indent=2),
+        })
+
+    # `missing_svg` is the pre-scanner report key; both list descriptors without a binary
+    for asset in list(mismatches.get("missing_binary", [])) + list(mismatches.get("missing_svg", [])):
+        rel_dir, asset_id, ext = split_asset_key(asset)
+        if ext not in (None, "svg"):
+            log_heal(f"Cannot synthesize .{ext} for '{rel_dir}/{asset_id}' — restore it manually.")
+            continue
+        svg_path = os.path.join(asset_root, rel_dir, f"{asset_id}.svg")
+        if svg_path in planned_paths or os.path.exists(svg_path):
+            continue
+        planned_paths.add(svg_path)
+        plan.append({
+            "action": "create_stub_svg",
+            "asset": asset_id,
+            "path": svg_path,
+            "content": STUB_SVG,
+        })
+
+    return plan
+
+
+# --- Batch Apply -----------------------------------------------------------
+
+def _discard(paths):
+    """Best-effort removal of temp files or rolled-back outputs."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def apply_repairs(plan):
+    """Apply a repair plan as one batch: stage every file, then rename all into place."""
+    staged = []
+    try:
+        for repair in plan:
+            target_dir = os.path.dirname(repair["path"])
+            os.makedirs(target_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".heal-", suffix=".tmp")
+            staged.append((tmp_path, repair["path"]))
+            with os.fdopen(fd, "w") as f:
+                f.write(repair["content"])
+    except Exception:
+        _discard(tmp for tmp, _ in staged)
+        raise
+
+    placed = []
+    try:
+        for tmp_path, final_path in staged:
+            os.replace(tmp_path, final_path)
+            placed.append(final_path)
+    except Exception:
+        # Roll back: healer only ever creates missing files, so removal restores the tree
+        _discard(placed)
+        _discard(tmp for tmp, final in staged if final not in placed)
+        raise
+
+    return len(placed)
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def heal_assets(mismatches=None, dry_run=False, applied=None, strict=False):
+    """Repair missing .json or .svg files based on mismatch data (dry_run only reports the plan).
+
+    When `applied` is a list, the repairs that were written are appended to it
+    as {"action", "asset", "path"} entries. With `strict`, a rolled-back batch
+    re-raises instead of returning 0.
+    """
+    plan = plan_repairs(mismatches)
+    verb = "Would create" if dry_run else "Created"
+    log_report = [f"{verb} {r['action'].replace('create_', '')}: {r['path']}" for r in plan]
+
+    if not plan:
+        log_report.append("No repairs needed.")
+
+    repairs = 0
+    if dry_run:
+        repairs = len(plan)
+        print(f"[HEALER] Dry run — {repairs} repairs planned, nothing written.")
+    else:
+        if plan:
+            try:
+                repairs = apply_repairs(plan)
+            except Exception as e:
+                log_heal(f"[ERROR] Healing batch rolled back: {e}")
+                print(f"[HEALER] Healing batch rolled back: {e}")
+                if strict:
+                    raise
+                return 0
+            log_heal(f"Applied {repairs} repairs in one batch.")
+            metrics.inc("dvos_assets_healed", repairs)
+            if applied is not None:
+                applied.extend({k: r[k] for k in ("action", "asset", "path")} for r in plan)
+        print(f"[HEALER] {repairs} total repairs applied.")
 
-    print(f"[HEALER] {repairs} total repairs applied.")
     for entry in log_report:
         print(" -", entry)
 
     return repairs
+
+
+def run_auto_healer(merged_path="systems/dvos/runtime/merged-asset-map.json"):
+    """Return merged-map descriptors whose files are missing (the generator's regen queue)."""
+    if not os.path.exists(merged_path):
+        log_heal("Merged asset map not found — nothing to regenerate.")
+        return []
+    merged = load_merged_map(merged_path)
+    missing = set(check_assets(merged, ".", LOG_PATH)["missing_files"])
+    queue = [asset for asset in merged.get("assets", []) if asset.get("path") in missing]
+    log_heal(f"{len(queue)} assets flagged for regeneration.")
+    return queue
@@ -0,0 +1,305 @@
+# DVOS Blob Store — Content-Addressed Asset Deduplication
+# Finds identical binaries across the site and DVOS asset trees (hashing only size collisions),
+# keeps one copy per sha256 under runtime/blobs/ and hardlinks every duplicate path to it
+# A manifest maps each path to its blob so missing checkouts can be materialized again
+#
+# Hardlinked duplicates share one inode: tools must replace files (write + rename), not edit in place.
+# Every DVOS writer does; pipeline output directories (optimized/responsive/generated) are
+# excluded anyway, and an existing blob is re-verified before new paths are linked to it.
+#
+# Scope: the store and manifest are local runtime state (gitignored). Deduping shrinks a
+# working tree on disk, not the git checkout or the deploy copy, and a fresh CI checkout has
+# no blobs for the verifier to fall back on. Scheduler cycles call materialize() before
+# verifying, so a deleted duplicate is restored rather than passed and then served as a 404.
+#
+# CLI (from the repo root):
+#   python -m systems.dvos blobs scan
+#   python -m systems.dvos blobs dedupe [--dry-run]
+#   python -m systems.dvos blobs materialize
+
+import errno
+import json
+import os
+import shutil
+from datetime import datetime
+
+from engine.image_optimizer import file_digest
+from engine.registry_loader import DVOSRegistry
+
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+DEFAULT_STORE = "systems/dvos/runtime/blobs"
+DEFAULT_MANIFEST = "systems/dvos/runtime/blob-manifest.json"
+DEFAULT_ROOTS = ["assets", "systems/dvos/assets"]
+DEFAULT_EXTENSIONS = [".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg", ".ico"]
+# Pipeline outputs: byte-identical derivatives of one source are expected, never shared
+DEFAULT_EXCLUDE = ["assets/optimized", "assets/responsive", "assets/generated"]
+
+
+def log_event(message):
+    """Append blob store events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [BLOBS] {message}\n")
+
+
+def get_config():
+    """Blob store settings from the registry, with defaults."""
+    config = DVOSRegistry.get_blobs()
+    optimization = DVOSRegistry.get_optimization()
+    exclude = list(config.get("exclude", DEFAULT_EXCLUDE))
+    for key in ("output_dir", "responsive_output_dir"):
+        if optimization.get(key):
+            exclude.append(optimization[key])
+    return {
+        "store": config.get("store", DEFAULT_STORE),
+        "manifest": config.get("manifest", DEFAULT_MANIFEST),
+        "roots": config.get("roots", DEFAULT_ROOTS),
+        "extensions": [e.lower() for e in config.get("extensions", DEFAULT_EXTENSIONS)],
+        "min_size": int(config.get("min_size", 1024)),
+        "exclude": sorted({os.path.normpath(path).replace("\\", "/") for path in exclude}),
+    }
+
+
+def blob_path(sha, store=DEFAULT_STORE):
+    """Return the store location for a sha256 digest (two-level fan-out)."""
+    return os.path.join(store, sha[:2], sha)
+
+
+# --- Manifest --------------------------------------------------------------
+
+def load_manifest(path=DEFAULT_MANIFEST):
+    """Load {path: {"sha256", "size", "mtime_ns"}} recorded by the last dedupe."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("files", {})
+    except Exception:
+        return {}
+
+
+def save_manifest(files, path=DEFAULT_MANIFEST):
+    """Write the manifest atomically."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": 1, "generated_at": datetime.utcnow().isoformat() + "Z", "files": files},
+                  f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def has_blob(path, manifest=None, store=DEFAULT_STORE):
+    """True when `path` is recorded in the manifest and its blob exists in the store."""
+    manifest = load_manifest() if manifest is None else manifest
+    entry = manifest.get(os.path.normpath(path).replace("\\", "/"))
+    return bool(entry) and os.path.isfile(blob_path(entry["sha256"], store))
+
+
+# --- Duplicate Detection ---------------------------------------------------
+
+def iter_files(roots, extensions=None, min_size=0, exclude=()):
+    """Yield (path, stat) for regular files under `roots` (one scandir pass, no dotfiles).
+
+    Directories listed in `exclude` (repo-relative) are skipped with everything below them.
+    """
+    exclude = set(exclude)
+    stack = [root for root in roots if os.path.isdir(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.normpath(entry.path).replace("\\", "/") not in exclude:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if extensions and os.path.splitext(entry.name)[1].lower() not in extensions:
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_size >= min_size:
+                        yield os.path.normpath(entry.path).replace("\\", "/"), stat
+
+
+def find_duplicates(roots, extensions=None, min_size=0, manifest=None, stats=None, exclude=()):
+    """Return {sha256: [paths]} for identical files; only files whose size collides are hashed.
+
+    Digests recorded in `manifest` are reused when size and mtime are unchanged,
+    and hardlinks already sharing an inode are hashed once.
+    """
+    manifest = manifest or {}
+    by_size = {}
+    for path, stat in iter_files(roots, extensions, min_size, exclude):
+        by_size.setdefault(stat.st_size, []).append((path, stat))
+
+    groups = {}
+    inode_digests = {}
+    hashed = 0
+    for size, files in by_size.items():
+        if len(files) < 2:
+            continue
+        for path, stat in files:
+            cached = manifest.get(path)
+            inode = (stat.st_dev, stat.st_ino)
+            if cached and cached.get("size") == size and cached.get("mtime_ns") == stat.st_mtime_ns:
+                sha = cached["sha256"]
+            elif inode in inode_digests:
+                sha = inode_digests[inode]
+            else:
+                sha = file_digest(path)
+                hashed += 1
+            inode_digests[inode] = sha
+            groups.setdefault(sha, []).append((path, stat))
+
+    if stats is not None:
+        stats["files"] = sum(len(files) for files in by_size.values())
+        stats["hashed"] = hashed
+    return {sha: sorted(files) for sha, files in groups.items() if len(files) > 1}
+
+
+# --- Linking ---------------------------------------------------------------
+
+def _link_or_copy(source, target):
+    """Hardlink `source` at `target`, falling back to a copy across filesystems."""
+    try:
+        os.link(source, target)
+        return True
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        shutil.copy2(source, target)
+        return False
+
+
+def _replace_with_link(blob, path):
+    """Atomically swap `path` for a hardlink to `blob` (temp link + rename)."""
+    tmp_path = os.path.join(os.path.dirname(path), f".blob-{os.path.basename(path)}.tmp")
+    try:
+        os.link(blob, tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return False
+
+
+def store_blob(source, sha, store=DEFAULT_STORE):
+    """Ensure the store holds `sha`, linking it from `source` when possible.
+
+    An existing blob is trusted only if it is `source`'s own inode or still hashes
+    to `sha`; a blob rewritten in place is replaced from `source` before reuse.
+    """
+    target = blob_path(sha, store)
+    if os.path.exists(target):
+        if os.path.samefile(source, target) or file_digest(target) == sha:
+            return target
+        log_event(f"[WARN] Blob {sha[:12]} no longer matches its digest — replacing it from {source}.")
+        tmp_path = f"{target}.tmp"
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, target)
+        return target
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    _link_or_copy(source, target)
+    return target
+
+
+def dedupe(config=None, dry_run=False):
+    """Move duplicate groups into the store and hardlink each path to its blob.
+
+    Paths that cannot be linked (e.g. the store is on another filesystem) are
+    still recorded in the manifest, so the verifier and materialize can resolve them.
+    """
+    config = config or get_config()
+    manifest = load_manifest(config["manifest"])
+    stats = {}
+    groups = find_duplicates(config["roots"], config["extensions"], config["min_size"], manifest, stats,
+                             config["exclude"])
+    result = {
+        "groups": len(groups),
+        "duplicates": sum(len(files) - 1 for files in groups.values()),
+        "bytes_saved": sum((len(files) - 1) * files[0][1].st_size for files in groups.values()),
+        "linked": 0,
+        "scanned": stats["files"],
+        "hashed": stats["hashed"],
+    }
+    if dry_run:
+        return result
+
+    for sha, files in groups.items():
+        blob = store_blob(files[0][0], sha, config["store"])
+        blob_stat = os.stat(blob)
+        for path, stat in files:
+            if (stat.st_dev, stat.st_ino) != (blob_stat.st_dev, blob_stat.st_ino):
+                if _replace_with_link(blob, path):
+                    result["linked"] += 1
+                    stat = os.stat(path)
+                else:
+                    log_event(f"[WARN] Could not hardlink {path}; resolved through the manifest only.")
+            manifest[path] = {"sha256": sha, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    # Drop entries whose file was edited since, or vanished without a blob to fall back on
+    for path, entry in list(manifest.items()):
+        if os.path.exists(path):
+            stat = os.stat(path)
+            if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                del manifest[path]
+        elif not has_blob(path, manifest, config["store"]):
+            del manifest[path]
+    save_manifest(manifest, config["manifest"])
+    log_event(
+        f"Dedupe: {result['groups']} groups, {result['duplicates']} duplicates, "
+        f"{result['bytes_saved']} bytes shared ({result['hashed']} of {result['scanned']} files hashed)."
+    )
+    return result
+
+
+def materialize(config=None):
+    """Recreate manifest paths that are missing on disk from their blobs."""
+    config = config or get_config()
+    restored = 0
+    for path, entry in load_manifest(config["manifest"]).items():
+        blob = blob_path(entry["sha256"], config["store"])
+        if os.path.exists(path) or not os.path.isfile(blob):
+            continue
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        _link_or_copy(blob, path)
+        restored += 1
+    if restored:
+        log_event(f"Materialized {restored} paths from the blob store.")
+    return restored
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DVOS content-addressed blob store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("scan", help="report duplicate binaries without changing anything")
+    dedupe_parser = sub.add_parser("dedupe", help="store duplicates once and hardlink their paths")
+    dedupe_parser.add_argument("--dry-run", action="store_true")
+    sub.add_parser("materialize", help="restore missing manifest paths from the store")
+    args = parser.parse_args(argv)
+
+    config = get_config()
+    if args.command == "scan":
+        groups = find_duplicates(config["roots"], config["extensions"], config["min_size"],
+                                 load_manifest(config["manifest"]), exclude=config["exclude"])
+        for sha, files in sorted(groups.items()):
+            print(f"[BLOBS] {sha[:12]}  {files[0][1].st_size} bytes")
+            for path, _ in files:
+                print(f"   - {path}")
+        print(f"[BLOBS] {len(groups)} duplicate groups found.")
+    elif args.command == "dedupe":
+        result = dedupe(config, dry_run=args.dry_run)
+        verb = "Would share" if args.dry_run else "Shared"
+        print(f"[BLOBS] {verb} {result['bytes_saved']} bytes across {result['duplicates']} duplicates "
+              f"({result['hashed']} of {result['scanned']} files hashed).")
+    elif args.command == "materialize":
+        print(f"[BLOBS] {materialize(config)} paths materialized.")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
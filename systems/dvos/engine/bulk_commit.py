@@ -0,0 +1,325 @@
+# DVOS Bulk Commit — git fast-import Backfills
+# Writes thousands of generated posts/variants as one commit (or one commit per day)
+# by streaming blobs and commits into `git fast-import`: no index, no working-tree re-stat
+# Every commit is then verified against the tree a normal `git add` + `git commit` would
+# produce (via a throwaway index); a mismatch rolls the branch back to where it started
+#
+# CLI (from the repo root):
+#   python -m systems.dvos backfill _posts assets/generated --per-day
+#   python -m systems.dvos backfill _posts --git-dir /tmp/test.git --branch main --no-sync-index
+
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from engine import metrics
+from engine.registry_loader import DVOSRegistry
+
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+DATE_PREFIX = re.compile(r"^(\d{4}-\d{2}-\d{2})-")
+FALLBACK_IDENT = ("DVOS", "dvos@localhost")
+
+
+def log_event(message):
+    """Append bulk commit events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [BULK-COMMIT] {message}\n")
+
+
+class BulkCommitError(Exception):
+    """Raised when fast-import fails or a written commit does not verify."""
+
+
+def git(git_dir, *args, input=None, env=None, cwd=None, check=True):
+    """Run git against `git_dir` and return stdout bytes (timed like run_git)."""
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            ["git", f"--git-dir={git_dir}", *args],
+            input=input, capture_output=True, env=env, cwd=cwd,
+        )
+    finally:
+        metrics.inc("dvos_git_duration_seconds", time.perf_counter() - start, command=args[0])
+    if check and result.returncode != 0:
+        raise BulkCommitError(f"git {args[0]} failed: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout
+
+
+def resolve_git_dir(source_root="."):
+    """Absolute git dir of the repository containing `source_root`."""
+    result = subprocess.run(["git", "-C", source_root, "rev-parse", "--absolute-git-dir"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise BulkCommitError(f"{source_root} is not inside a git repository")
+    return result.stdout.strip()
+
+
+def rev_parse(git_dir, rev):
+    """Resolve `rev` to a sha, or None if it does not exist."""
+    out = git(git_dir, "rev-parse", "--verify", "--quiet", rev, check=False).strip()
+    return out.decode() or None
+
+
+# --- Planning --------------------------------------------------------------
+
+def collect_files(paths, source_root="."):
+    """Expand files/directories into sorted repo-relative file paths."""
+    files = set()
+    for path in paths:
+        full = os.path.join(source_root, path)
+        if os.path.isfile(full):
+            files.add(os.path.normpath(path).replace("\\", "/"))
+            continue
+        for root, dirs, names in os.walk(full):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                if not name.startswith("."):
+                    rel = os.path.relpath(os.path.join(root, name), source_root)
+                    files.add(rel.replace("\\", "/"))
+    return sorted(files)
+
+
+def _blob_sha(path):
+    """Git blob id of a file's raw bytes (no clean filters applied)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def changed_files(git_dir, parent, files, source_root="."):
+    """Drop files already committed unchanged in `parent`; only size matches are hashed."""
+    if parent is None or not files:
+        return files
+    existing = {}
+    out = git(git_dir, "ls-tree", "-r", "-l", "-z", parent, "--", *sorted({f.split("/")[0] for f in files}))
+    for record in out.split(b"\0"):
+        if not record:
+            continue
+        meta, path = record.split(b"\t", 1)
+        _, _, sha, size = meta.split()
+        existing[path.decode()] = (sha.decode(), int(size) if size != b"-" else -1)
+    changed = []
+    for path in files:
+        entry = existing.get(path)
+        full = os.path.join(source_root, path)
+        if entry and entry[1] == os.path.getsize(full) and entry[0] == _blob_sha(full):
+            continue
+        changed.append(path)
+    return changed
+
+
+def group_by_day(files, source_root="."):
+    """{YYYY-MM-DD: [paths]} from the post-style filename prefix, else the file's mtime (UTC)."""
+    groups = {}
+    for path in files:
+        match = DATE_PREFIX.match(os.path.basename(path))
+        if match:
+            day = match.group(1)
+        else:
+            mtime = os.path.getmtime(os.path.join(source_root, path))
+            day = datetime.fromtimestamp(mtime, tz=timezone.utc).strftime("%Y-%m-%d")
+        groups.setdefault(day, []).append(path)
+    return dict(sorted(groups.items()))
+
+
+def _count_files(count):
+    """'1 file' / 'N files' for commit messages."""
+    return f"{count} file" if count == 1 else f"{count} files"
+
+
+def identity(git_dir):
+    """(name, email) from git config, falling back to a DVOS identity."""
+    name = git(git_dir, "config", "user.name", check=False).strip().decode()
+    email = git(git_dir, "config", "user.email", check=False).strip().decode()
+    return (name, email) if name and email else FALLBACK_IDENT
+
+
+# --- fast-import Stream ----------------------------------------------------
+
+def _data(payload):
+    return b"data %d\n" % len(payload) + payload + b"\n"
+
+
+def write_commits(git_dir, ref, parent, commits, source_root="."):
+    """Stream `commits` [(message, timestamp, [paths])] into fast-import on top of `parent`.
+
+    Files are read one at a time; returns ([commit shas], {path: (mode, blob sha)}).
+    """
+    name, email = identity(git_dir)
+    now = int(time.time())
+    fd, marks_path = tempfile.mkstemp(prefix="dvos-marks-")
+    os.close(fd)
+    proc = subprocess.Popen(
+        ["git", f"--git-dir={git_dir}", "fast-import", "--quiet", "--done", f"--export-marks={marks_path}"],
+        stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    start = time.perf_counter()
+    mark = 0
+    blob_marks = {}
+    commit_marks = []
+    try:
+        out = proc.stdin
+        for index, (message, timestamp, paths) in enumerate(commits):
+            file_marks = []
+            for path in paths:
+                full = os.path.join(source_root, path)
+                mark += 1
+                with open(full, "rb") as f:
+                    out.write(b"blob\nmark :%d\n" % mark + _data(f.read()))
+                mode = b"100755" if os.access(full, os.X_OK) else b"100644"
+                file_marks.append((mode, mark, path))
+                blob_marks[path] = (mode.decode(), mark)
+            mark += 1
+            commit_marks.append(mark)
+            out.write(b"commit %s\nmark :%d\n" % (ref.encode(), mark))
+            out.write(b"author %s <%s> %d +0000\n" % (name.encode(), email.encode(), timestamp))
+            out.write(b"committer %s <%s> %d +0000\n" % (name.encode(), email.encode(), now))
+            out.write(_data(message.encode("utf-8")))
+            if index == 0 and parent:
+                out.write(b"from %s\n" % parent.encode())
+            for mode, blob_mark, path in file_marks:
+                out.write(b"M %s :%d %s\n" % (mode, blob_mark, path.encode("utf-8")))
+            out.write(b"\n")
+        out.write(b"done\n")
+        out.close()
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise BulkCommitError(f"git fast-import failed: {stderr.decode(errors='replace').strip()}")
+        with open(marks_path, "r") as f:
+            marks = dict(line.split() for line in f if line.strip())
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        metrics.inc("dvos_git_duration_seconds", time.perf_counter() - start, command="fast-import")
+        os.unlink(marks_path)
+    return [marks[f":{m}"] for m in commit_marks], {p: (mode, marks[f":{m}"]) for p, (mode, m) in blob_marks.items()}
+
+
+# --- Verification ----------------------------------------------------------
+
+def verify_commits(git_dir, parent, commit_shas, commits, source_root="."):
+    """Rebuild each commit's tree the normal way and compare it with what fast-import wrote.
+
+    The expected tree comes from a throwaway index: read-tree of the previous
+    commit, `git update-index --add` of the same files from the working copy
+    (so clean/eol filters apply as they would for `git add`), then write-tree.
+    Also checks each commit's parent link.
+    """
+    fd, index_path = tempfile.mkstemp(prefix="dvos-index-")
+    os.close(fd)
+    os.unlink(index_path)
+    env = dict(os.environ, GIT_INDEX_FILE=index_path, GIT_WORK_TREE=os.path.abspath(source_root))
+    cwd = os.path.abspath(source_root)
+    mismatches = []
+    try:
+        if parent:
+            git(git_dir, "read-tree", parent, env=env)
+        previous = parent
+        for sha, (message, _, paths) in zip(commit_shas, commits):
+            git(git_dir, "update-index", "--add", "--", *paths, env=env, cwd=cwd)
+            expected = git(git_dir, "write-tree", env=env, cwd=cwd).strip().decode()
+            actual = rev_parse(git_dir, f"{sha}^{{tree}}")
+            parents = git(git_dir, "rev-list", "--parents", "-n", "1", sha).split()[1:]
+            if actual != expected:
+                mismatches.append(f"{sha[:12]} tree {actual} != expected {expected} ({message})")
+            if [p.decode() for p in parents] != ([previous] if previous else []):
+                mismatches.append(f"{sha[:12]} has unexpected parents {parents}")
+            previous = sha
+    finally:
+        if os.path.exists(index_path):
+            os.unlink(index_path)
+    return mismatches
+
+
+def sync_index(git_dir, paths_to_blobs, source_root="."):
+    """Point the checked-out index at the new blobs for just these paths (no tree-wide stat)."""
+    lines = "".join(f"{mode} {sha}\t{path}\n" for path, (mode, sha) in paths_to_blobs.items())
+    env = dict(os.environ, GIT_WORK_TREE=os.path.abspath(source_root))
+    git(git_dir, "update-index", "--index-info", input=lines.encode("utf-8"), env=env,
+        cwd=os.path.abspath(source_root))
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def bulk_commit(paths, per_day=False, branch=None, git_dir=None, source_root=".",
+                message=None, verify=True, sync=True):
+    """Commit new/changed files under `paths` via fast-import and verify the result.
+
+    Returns {"commits", "files", "head"}; raises BulkCommitError (with the
+    branch restored) when fast-import or verification fails.
+    """
+    repo_config = DVOSRegistry.get_repo_config()
+    branch = branch or repo_config.get("branch", "main")
+    prefix = repo_config.get("commit_prefix", "[DVOS]")
+    git_dir = os.path.abspath(git_dir) if git_dir else resolve_git_dir(source_root)
+    ref = f"refs/heads/{branch}"
+    parent = rev_parse(git_dir, ref)
+
+    files = changed_files(git_dir, parent, collect_files(paths, source_root), source_root)
+    if not files:
+        log_event("Nothing to backfill — all files already committed.")
+        return {"commits": 0, "files": 0, "head": parent}
+
+    now = int(time.time())
+    if per_day:
+        commits = [
+            (f"{prefix} Backfill {day} ({_count_files(len(group))})",
+             int(datetime.strptime(day, "%Y-%m-%d").replace(hour=12, tzinfo=timezone.utc).timestamp()),
+             group)
+            for day, group in group_by_day(files, source_root).items()
+        ]
+    else:
+        commits = [(message or f"{prefix} Backfill {_count_files(len(files))}", now, files)]
+
+    commit_shas, blobs = write_commits(git_dir, ref, parent, commits, source_root)
+    if verify:
+        mismatches = verify_commits(git_dir, parent, commit_shas, commits, source_root)
+        if mismatches:
+            if parent:
+                git(git_dir, "update-ref", ref, parent, commit_shas[-1])
+            else:
+                git(git_dir, "update-ref", "-d", ref, commit_shas[-1])
+            for line in mismatches:
+                log_event(f"[ERROR] Verification failed: {line}")
+            raise BulkCommitError(f"{len(mismatches)} verification mismatches; {ref} restored")
+
+    is_bare = git(git_dir, "rev-parse", "--is-bare-repository").strip() == b"true"
+    head_ref = git(git_dir, "symbolic-ref", "-q", "HEAD", check=False).strip().decode()
+    if sync and not is_bare and head_ref == ref:
+        sync_index(git_dir, blobs, source_root)
+
+    log_event(f"Backfilled {len(files)} files in {len(commit_shas)} commit(s) on {branch} → {commit_shas[-1][:12]}.")
+    return {"commits": len(commit_shas), "files": len(files), "head": commit_shas[-1]}
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Commit backfilled files through git fast-import.")
+    parser.add_argument("paths", nargs="+", help="files or directories to commit (e.g. _posts)")
+    parser.add_argument("--per-day", action="store_true", help="one commit per YYYY-MM-DD instead of one overall")
+    parser.add_argument("--branch", help="target branch (default: repo.branch)")
+    parser.add_argument("--git-dir", help="target repository (e.g. a local bare repo for testing)")
+    parser.add_argument("--source-root", default=".", help="directory the paths are read from")
+    parser.add_argument("-m", "--message", help="commit message for single-commit mode")
+    parser.add_argument("--no-verify", action="store_true", help="skip the normal-commit tree comparison")
+    parser.add_argument("--no-sync-index", action="store_true", help="leave the checked-out index untouched")
+    args = parser.parse_args(argv)
+
+    try:
+        result = bulk_commit(args.paths, args.per_day, args.branch, args.git_dir, args.source_root,
+                             args.message, verify=not args.no_verify, sync=not args.no_sync_index)
+    except BulkCommitError as e:
+        print(f"[BULK-COMMIT] ❌ {e}")
+        return 1
+    print(f"[BULK-COMMIT] ✅ {result['files']} files in {result['commits']} commit(s) → {result['head']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
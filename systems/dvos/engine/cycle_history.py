@@ -0,0 +1,243 @@
+# DVOS Cycle History — Embedded SQLite Store
+# Records every scheduler cycle, per-stage timing, verification issue and heal action
+# Indexed on time, status and asset id so history queries never grep asset-sync.log
+# Each cycle is written as one batched transaction on a long-lived connection
+#
+# Query CLI (from the repo root):
+#   python systems/dvos/engine/cycle_history.py recent -n 20
+#   python systems/dvos/engine/cycle_history.py healed --since 7d
+#   python systems/dvos/engine/cycle_history.py trend --stage analysis --since 30d
+#   python systems/dvos/engine/cycle_history.py asset button-primary
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+DEFAULT_DB_PATH = "systems/dvos/runtime/cycle-history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    id          INTEGER PRIMARY KEY,
+    ts          REAL NOT NULL,
+    started_at  TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    assets      INTEGER,
+    healed      INTEGER,
+    optimized   INTEGER,
+    committed   INTEGER,
+    duration_s  REAL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    cycle_id    INTEGER NOT NULL REFERENCES cycles(id),
+    stage       TEXT NOT NULL,
+    duration_s  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issues (
+    cycle_id    INTEGER NOT NULL REFERENCES cycles(id),
+    kind        TEXT NOT NULL,
+    asset_id    TEXT,
+    detail      TEXT
+);
+CREATE TABLE IF NOT EXISTS heals (
+    cycle_id    INTEGER NOT NULL REFERENCES cycles(id),
+    action      TEXT NOT NULL,
+    asset_id    TEXT,
+    path        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_cycles_ts ON cycles(ts);
+CREATE INDEX IF NOT EXISTS idx_cycles_status ON cycles(status, ts);
+CREATE INDEX IF NOT EXISTS idx_stages_stage ON stages(stage, cycle_id);
+CREATE INDEX IF NOT EXISTS idx_issues_asset ON issues(asset_id);
+CREATE INDEX IF NOT EXISTS idx_heals_asset ON heals(asset_id);
+"""
+
+_connections = {}
+_lock = threading.Lock()
+
+
+# --- Connection ------------------------------------------------------------
+
+def get_connection(db_path=DEFAULT_DB_PATH):
+    """Return a cached connection, creating the database and indexes on first use."""
+    db_path = os.path.abspath(db_path)  # relative paths follow the cwd, so key on the resolved one
+    with _lock:
+        conn = _connections.get(db_path)
+        if conn is None:
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            _connections[db_path] = conn
+        return conn
+
+
+# --- Recording -------------------------------------------------------------
+
+def _asset_id_from_path(path):
+    return os.path.splitext(os.path.basename(str(path)))[0]
+
+
+def issue_rows(verification):
+    """Flatten a verify_assets() report into (kind, asset_id, detail) rows."""
+    rows = []
+    if not verification:
+        return rows
+    for path in verification.get("missing_files", []):
+        rows.append(("missing_file", _asset_id_from_path(path), path))
+    for asset_id in verification.get("duplicates", []):
+        rows.append(("duplicate", asset_id, None))
+    for entry in verification.get("invalid_entries", []):
+        asset_id = entry.get("id") if isinstance(entry, dict) else None
+        rows.append(("invalid_entry", asset_id, str(entry)))
+    return rows
+
+
+def record_cycle(cycle_data, start_time, stages=None, verification=None, heals=None,
+                 db_path=DEFAULT_DB_PATH):
+    """Write one cycle, its stages, issues and heal actions in a single transaction."""
+    conn = get_connection(db_path)
+    stages = stages or {}
+    heals = heals or []
+    with _lock, conn:
+        cursor = conn.execute(
+            "INSERT INTO cycles (ts, started_at, status, assets, healed, optimized, committed, duration_s) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                start_time,
+                datetime.utcfromtimestamp(start_time).isoformat() + "Z",
+                cycle_data.get("status", "ok"),
+                cycle_data.get("assets", 0),
+                cycle_data.get("healed", 0),
+                cycle_data.get("optimized", 0),
+                int(bool(cycle_data.get("commit"))),
+                float(str(cycle_data.get("duration", "0")).rstrip("s") or 0),
+            ),
+        )
+        cycle_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO stages (cycle_id, stage, duration_s) VALUES (?, ?, ?)",
+            [(cycle_id, stage, duration) for stage, duration in stages.items()],
+        )
+        conn.executemany(
+            "INSERT INTO issues (cycle_id, kind, asset_id, detail) VALUES (?, ?, ?, ?)",
+            [(cycle_id, *row) for row in issue_rows(verification)],
+        )
+        conn.executemany(
+            "INSERT INTO heals (cycle_id, action, asset_id, path) VALUES (?, ?, ?, ?)",
+            [(cycle_id, h.get("action"), h.get("asset"), h.get("path")) for h in heals],
+        )
+    return cycle_id
+
+
+# --- Queries ---------------------------------------------------------------
+
+def parse_since(value):
+    """Convert '7d', '12h', '30m' or an ISO date into a unix timestamp."""
+    if value is None:
+        return 0.0
+    units = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+    if value[-1:] in units and value[:-1].isdigit():
+        return time.time() - int(value[:-1]) * units[value[-1]]
+    parsed = datetime.fromisoformat(value.rstrip("Z"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def recent_cycles(limit=20, status=None, db_path=DEFAULT_DB_PATH):
+    """Return the most recent cycles, optionally filtered by status."""
+    query = "SELECT id, started_at, status, assets, healed, duration_s FROM cycles"
+    params = []
+    if status:
+        query += " WHERE status = ?"
+        params.append(status)
+    query += " ORDER BY ts DESC LIMIT ?"
+    params.append(limit)
+    return get_connection(db_path).execute(query, params).fetchall()
+
+
+def healed_cycles(since=None, db_path=DEFAULT_DB_PATH):
+    """Return cycles that applied heal actions since a point in time."""
+    return get_connection(db_path).execute(
+        "SELECT c.id, c.started_at, h.action, h.asset_id, h.path "
+        "FROM heals h JOIN cycles c ON c.id = h.cycle_id "
+        "WHERE c.ts >= ? ORDER BY c.ts DESC",
+        (parse_since(since),),
+    ).fetchall()
+
+
+def stage_trend(stage, since=None, db_path=DEFAULT_DB_PATH):
+    """Return daily count / average / max duration for one stage."""
+    return get_connection(db_path).execute(
+        "SELECT substr(c.started_at, 1, 10) AS day, COUNT(*), AVG(s.duration_s), MAX(s.duration_s) "
+        "FROM stages s JOIN cycles c ON c.id = s.cycle_id "
+        "WHERE s.stage = ? AND c.ts >= ? GROUP BY day ORDER BY day",
+        (stage, parse_since(since)),
+    ).fetchall()
+
+
+def asset_history(asset_id, db_path=DEFAULT_DB_PATH):
+    """Return every issue and heal action recorded for one asset id."""
+    conn = get_connection(db_path)
+    issues = conn.execute(
+        "SELECT c.started_at, 'issue', i.kind, i.detail FROM issues i "
+        "JOIN cycles c ON c.id = i.cycle_id WHERE i.asset_id = ?",
+        (asset_id,),
+    ).fetchall()
+    heals = conn.execute(
+        "SELECT c.started_at, 'heal', h.action, h.path FROM heals h "
+        "JOIN cycles c ON c.id = h.cycle_id WHERE h.asset_id = ?",
+        (asset_id,),
+    ).fetchall()
+    return sorted(issues + heals, reverse=True)
+
+
+# --- Query CLI -------------------------------------------------------------
+
+def _print_rows(headers, rows):
+    if not rows:
+        print("(no results)")
+        return
+    table = [headers] + [["" if v is None else (f"{v:.3f}" if isinstance(v, float) else str(v)) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for row in table:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the DVOS cycle history store.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="path to the history database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    recent = sub.add_parser("recent", help="most recent cycles")
+    recent.add_argument("-n", "--limit", type=int, default=20)
+    recent.add_argument("--status")
+
+    healed = sub.add_parser("healed", help="cycles that healed assets")
+    healed.add_argument("--since", default="7d")
+
+    trend = sub.add_parser("trend", help="daily duration trend for a stage")
+    trend.add_argument("--stage", default="analysis")
+    trend.add_argument("--since", default="30d")
+
+    asset = sub.add_parser("asset", help="issues and heals for one asset id")
+    asset.add_argument("asset_id")
+
+    args = parser.parse_args(argv)
+    if args.command == "recent":
+        _print_rows(["id", "started_at", "status", "assets", "healed", "duration_s"],
+                    recent_cycles(args.limit, args.status, args.db))
+    elif args.command == "healed":
+        _print_rows(["cycle", "started_at", "action", "asset", "path"], healed_cycles(args.since, args.db))
+    elif args.command == "trend":
+        _print_rows(["day", "cycles", "avg_s", "max_s"], stage_trend(args.stage, args.since, args.db))
+    elif args.command == "asset":
+        _print_rows(["when", "type", "kind", "detail"], asset_history(args.asset_id, args.db))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,10 @@
 import os
 import json
 import subprocess
-import requests
+import time
 from datetime import datetime
+from urllib.parse import urlparse
+from engine import metrics
 from engine.registry_loader import DVOSRegistry
 
 LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
@@ -19,6 +21,15 @@ def log_event(message):
         log.write(f"[{datetime.utcnow().isoformat()}Z] [AUTO-COMMIT] {message}\n")
 
 
+def run_git(args):
+    """Run a git subprocess, recording its wall time per git command."""
+    start = time.perf_counter()
+    try:
+        return subprocess.run(["git", *args], check=True)
+    finally:
+        metrics.inc("dvos_git_duration_seconds", time.perf_counter() - start, command=args[0])
+
+
 def git_commit_and_push(commit_message):
     """Commit and push changes to Git if enabled in registry."""
     repo_config = DVOSRegistry.get_repo_config()
@@ -30,9 +41,9 @@ def git_commit_and_push(commit_message):
         return False
 
     try:
-        subprocess.run(["git", "add", "-A"], check=True)
-        subprocess.run(["git", "commit", "-m", commit_message], check=True)
-        subprocess.run(["git", "push", "origin", branch], check=True)
+        run_git(["add", "-A"])
+        run_git(["commit", "-m", commit_message])
+        run_git(["push", "origin", branch])
         log_event(f"Auto-commit successful: {commit_message}")
         return True
     except subprocess.CalledProcessError as e:
@@ -63,6 +74,8 @@ def send_webhook_notification(summary, cycle_data=None):
         log_event("No webhook URLs configured in registry.")
         return False
 
+    import requests  # deferred: only paid for when a notification is actually sent
+
     # Color code for Discord-style embeds
     color_map = {
         "ok": 0x57F287,       # green
@@ -113,7 +126,13 @@ def send_webhook_notification(summary, cycle_data=None):
             else:
                 payload = {"text": summary}
 
+            start = time.perf_counter()
             response = requests.post(url, json=payload, timeout=10)
+            # Label by host only — webhook paths carry secrets
+            metrics.observe(
+                "dvos_webhook_latency_seconds", time.perf_counter() - start,
+                destination=urlparse(url).netloc
+            )
             if response.status_code in [200, 204]:
                 success_count += 1
                 log_event(f"Webhook notification sent successfully → {url}")
@@ -5,11 +5,6 @@ import os
 import json
 from datetime import datetime
 
-from engine.analyzer import run_analysis
-from engine.integrity_verifier import verify_assets
-from engine.auto_healer import heal_assets
-from engine.generator import generate_asset_variant
-
 LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
 MERGED_MAP_PATH = "systems/dvos/runtime/merged-asset-map.json"
 ASSET_ROOT = "systems/dvos/assets"
@@ -23,31 +18,31 @@ def log_cycle(message):
 
 
 def detect_asset_mismatches():
-    """Compare .svg assets and .json descriptors to find missing counterparts."""
-    svg_files = set()
-    json_files = set()
+    """Pair binaries with descriptors by (relative dir, stem) in one scan of ASSET_ROOT.
 
-    for root, _, files in os.walk(ASSET_ROOT):
-        for f in files:
-            full = os.path.join(root, f)
-            if f.endswith(".svg"):
-                svg_files.add(os.path.splitext(f)[0])
-            elif f.endswith(".json") and "asset-map" not in f:
-                json_files.add(os.path.splitext(f)[0])
+    Pairing rules come from runtime.pairing_rules; the report carries the full
+    mismatch sets plus the new_* subsets that did not exist in the previous cycle.
+    """
+    from engine.mismatch_scanner import DEFAULT_PAIRING_RULES, STATE_PATH, detect_mismatches
+    from engine.registry_loader import DVOSRegistry
 
-    missing_json = svg_files - json_files
-    missing_svg = json_files - svg_files
-
-    return {
-        "missing_json": list(missing_json),
-        "missing_svg": list(missing_svg),
-        "total_svg": len(svg_files),
-        "total_json": len(json_files)
-    }
+    runtime = DVOSRegistry.get_runtime()
+    return detect_mismatches(
+        runtime.get("pairing_rules", DEFAULT_PAIRING_RULES),
+        ASSET_ROOT,
+        runtime.get("mismatch_state", STATE_PATH),
+    )
 
 
 def run_dvos_cycle():
     """Main DVOS runtime cycle."""
+    # Stage modules load lazily so detect_asset_mismatches() stays import-light
+    from engine.analyzer import run_analysis
+    from engine.integrity_verifier import verify_assets
+    from engine.auto_healer import heal_assets
+    from engine.mismatch_scanner import save_state as save_mismatch_state
+    from engine.generator import generate_asset_variant
+
     log_cycle("\n--- Starting DVOS Cycle (Self-Healing) ---")
 
     # 1️⃣ Analyze
@@ -70,14 +65,21 @@ def run_dvos_cycle():
 
     # 3️⃣ Detect mismatches
     mismatches = detect_asset_mismatches()
-    mj, ms = len(mismatches["missing_json"]), len(mismatches["missing_svg"])
-    log_cycle(f"[SCAN] {mj} missing JSON, {ms} missing SVG files detected.")
+    mj, mb = len(mismatches["missing_json"]), len(mismatches["missing_binary"])
+    nj, nb = len(mismatches["new_missing_json"]), len(mismatches["new_missing_binary"])
+    log_cycle(f"[SCAN] {mj} missing JSON ({nj} new), {mb} missing binaries ({nb} new), "
+              f"{len(mismatches['resolved'])} resolved.")
 
-    # 4️⃣ Heal assets automatically
+    # 4️⃣ Heal only mismatches that appeared since the last cycle
     try:
-        healed = heal_assets(mismatches)
+        healed = heal_assets(
+            {"missing_json": mismatches["new_missing_json"], "missing_binary": mismatches["new_missing_binary"]},
+            strict=True,
+        )
+        save_mismatch_state(mismatches)
         log_cycle(f"[HEALER] Complete — {healed} repairs applied.")
     except Exception as e:
+        # State is left untouched so the same mismatches count as new next cycle
         log_cycle(f"[ERROR] Healer failed: {e}")
 
     # 5️⃣ Generate variants
@@ -1,7 +1,17 @@
+import hashlib
+import json
 import os
-import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Also runnable as a script: engine modules import each other as `engine.*`,
+# relative to systems/dvos
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.site_feeds import add_post, read_front_matter  # noqa: E402
+
 # --- CONFIG ---
 NICHES = [
     "AI tools for freelancers",
@@ -40,102 +50,220 @@ TOOLS = {
 }
 
 CONTENT_DIR = "./_posts"
-os.makedirs(CONTENT_DIR, exist_ok=True)
+RENDER_CACHE_DIR = "systems/dvos/runtime/render-cache"
+DEFAULT_SEED = "fullsend"
+# Posts carry a fixed publish time so output never depends on the wall clock
+PUBLISH_TIME = "12:00:00"
 
 
-# --- CORE GENERATOR ---
-def generate_article(keyword: str) -> str:
-    title = f"The Ultimate Guide to {keyword.title()}"
-    today = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-
-    intro = (
-        f"## 🚀 Introduction\n"
-        f"Imagine turning {keyword} into a system that works while you sleep. "
-        f"In this article, we’ll explore how automation, smart tools, and the right strategies "
-        f"can help you master {keyword} — faster and smarter.\n"
-    )
+# --- TEMPLATES ---
+# Editing either template changes template_version() for the affected niches;
+# `--regenerate` then re-renders only posts whose stored version differs.
+FRONT_MATTER_TEMPLATE = """---
+layout: post
+title: "{title}"
+date: {date}
+tags: [{tag}]
+niche: "{keyword}"
+template_version: {version}
+description: "Discover how {keyword} can help you build scalable income and automate your workflow."
+---
+"""
 
-    why_section = (
-        f"## 💡 Why It Matters\n"
-        f"{keyword.title()} isn’t just a buzzword — it’s reshaping how people earn, learn, "
-        f"and live. Mastering this space helps you gain freedom, scalability, and digital leverage.\n"
-    )
+BODY_TEMPLATE = """
+# {title}
 
-    insights = (
-        f"## ⚙️ Key Insights\n"
-        f"- 🔍 **Simplify Everything:** The best {keyword} strategies remove friction, not add it.\n"
-        f"- 🧠 **Automate Consistently:** Systems outperform hustle. Set up once, benefit daily.\n"
-        f"- 💬 **Community Wins:** Learn from others who are already succeeding in {keyword}.\n"
-    )
+## 🚀 Introduction
+Imagine turning {keyword} into a system that works while you sleep. In this article, we’ll explore how automation, smart tools, and the right strategies can help you master {keyword} — faster and smarter.
 
-    steps = (
-        f"## 🧭 Step-by-Step Framework\n"
-        f"1. **Identify Opportunities** — Spot trends or bottlenecks related to {keyword}.\n"
-        f"2. **Choose Your Tools** — Mix AI and automation to boost results.\n"
-        f"3. **Set & Forget** — Build repeatable systems that grow passively.\n"
-        f"4. **Measure the Gains** — Track efficiency and income improvements.\n"
-    )
+## 💡 Why It Matters
+{keyword_title} isn’t just a buzzword — it’s reshaping how people earn, learn, and live. Mastering this space helps you gain freedom, scalability, and digital leverage.
 
-    case_study = (
-        f"## 📊 Real-World Example\n"
-        f"> “Sarah started using AI-powered {keyword} strategies and reduced manual work by 60%, "
-        f"while doubling her client capacity.”\n"
-    )
+## ⚙️ Key Insights
+- 🔍 **Simplify Everything:** The best {keyword} strategies remove friction, not add it.
+- 🧠 **Automate Consistently:** Systems outperform hustle. Set up once, benefit daily.
+- 💬 **Community Wins:** Learn from others who are already succeeding in {keyword}.
 
-    tools_list = TOOLS.get(keyword, [])
-    tool_section = "## 🔗 Top Tools & Resources\n"
-    for name, link in tools_list:
-        tool_section += f"- [{name}]({link})\n"
+## 🧭 Step-by-Step Framework
+1. **Identify Opportunities** — Spot trends or bottlenecks related to {keyword}.
+2. **Choose Your Tools** — Mix AI and automation to boost results.
+3. **Set & Forget** — Build repeatable systems that grow passively.
+4. **Measure the Gains** — Track efficiency and income improvements.
 
-    wrap_up = (
-        f"## ✨ Wrap-Up\n"
-        f"In a world that moves at digital speed, mastering {keyword} can give you a lasting edge. "
-        f"Pick one tool from this guide and take action today — the results compound fast.\n\n"
-        f"*Stay tuned for tomorrow’s AI-powered strategy from FullSend Passive V1.*\n"
-    )
+## 📊 Real-World Example
+> “Sarah started using AI-powered {keyword} strategies and reduced manual work by 60%, while doubling her client capacity.”
 
-    # --- FINAL ASSEMBLY ---
-    article = f"""---
-layout: post
-title: "{title}"
-date: {today}
-tags: [{keyword.replace(" ", "-")}]
-description: "Discover how {keyword} can help you build scalable income and automate your workflow."
----
+{tool_section}
+## ✨ Wrap-Up
+In a world that moves at digital speed, mastering {keyword} can give you a lasting edge. Pick one tool from this guide and take action today — the results compound fast.
 
-# {title}
+*Stay tuned for tomorrow’s AI-powered strategy from FullSend Passive V1.*
 
-{intro}
-{why_section}
-{insights}
-{steps}
-{case_study}
-{tool_section}
-{wrap_up}
 
 ---
 
 *Affiliate Disclosure: This article may contain affiliate links. If you use these links, we may earn a commission at no cost to you.*
 """
-    return article
+
+
+# --- DETERMINISTIC INPUTS ---
+def template_version(keyword: str) -> str:
+    """Short digest of everything a niche's body depends on (template text + tool list)."""
+    source = json.dumps([FRONT_MATTER_TEMPLATE, BODY_TEMPLATE, TOOLS.get(keyword, [])], ensure_ascii=False)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
+
+
+def pick_niche(date: str, seed: str = DEFAULT_SEED) -> str:
+    """Choose the niche for a date from the seed (sha256-based, identical on every machine)."""
+    digest = hashlib.sha256(f"{seed}:{date}".encode("utf-8")).digest()
+    return NICHES[int.from_bytes(digest[:8], "big") % len(NICHES)]
+
+
+def slugify(keyword: str) -> str:
+    return keyword.lower().replace(" ", "-")
+
+
+# --- CORE GENERATOR ---
+def render_body(keyword: str) -> str:
+    """Render the date-independent article body for a niche."""
+    tool_section = "## 🔗 Top Tools & Resources\n"
+    for name, link in TOOLS.get(keyword, []):
+        tool_section += f"- [{name}]({link})\n"
+    return BODY_TEMPLATE.format(
+        title=f"The Ultimate Guide to {keyword.title()}",
+        keyword=keyword,
+        keyword_title=keyword.title(),
+        tool_section=tool_section,
+    )
+
+
+def render_front_matter(keyword: str, date: str) -> str:
+    """Render the front matter block for a niche published at `date` ('YYYY-MM-DD HH:MM:SS')."""
+    return FRONT_MATTER_TEMPLATE.format(
+        title=f"The Ultimate Guide to {keyword.title()}",
+        date=date,
+        tag=keyword.replace(" ", "-"),
+        keyword=keyword,
+        version=template_version(keyword),
+    )
+
+
+def cached_body(keyword: str, cache_dir: str = RENDER_CACHE_DIR) -> str:
+    """Body for (niche, template version), rendered once and reused for every later date."""
+    path = os.path.join(cache_dir, template_version(keyword), f"{slugify(keyword)}.md")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return f.read()
+    body = render_body(keyword)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return body
+
+
+def generate_article(keyword: str, date: str = None, cache_dir: str = RENDER_CACHE_DIR) -> str:
+    """Full post: freshly patched front matter + the cached body for (niche, template version)."""
+    date = date or f"{datetime.utcnow():%Y-%m-%d} {PUBLISH_TIME}"
+    return render_front_matter(keyword, date) + cached_body(keyword, cache_dir)
+
+
+def write_post(filepath: str, content: str) -> bool:
+    """Write a post with LF endings; returns False when the file already holds `content`."""
+    if os.path.exists(filepath):
+        with open(filepath, "r", encoding="utf-8", newline="") as f:
+            if f.read() == content:
+                return False
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
+    return True
+
+
+# --- REGENERATION ---
+def stale_posts(content_dir: str = CONTENT_DIR):
+    """Yield (path, niche, date) for generated posts rendered with an outdated template.
+
+    Only posts carrying `niche` and `template_version` front matter are considered;
+    hand-written and legacy posts are never rewritten.
+    """
+    for filename in sorted(os.listdir(content_dir)):
+        if not filename.endswith(".md"):
+            continue
+        path = os.path.join(content_dir, filename)
+        front_matter = read_front_matter(path)
+        keyword = front_matter.get("niche")
+        if keyword in TOOLS and front_matter.get("template_version") != template_version(keyword):
+            yield path, keyword, front_matter.get("date", "")
+
+
+def _rerender(task):
+    path, keyword, date = task
+    return path if write_post(path, generate_article(keyword, date)) else None
+
+
+def regenerate(content_dir: str = CONTENT_DIR, workers: int = 0):
+    """Re-render stale posts in parallel, keeping each post's original date."""
+    tasks = list(stale_posts(content_dir))
+    if not tasks:
+        print("✅ All generated posts match the current templates.")
+        return []
+    # Warm the body cache once per niche so workers only patch front matter
+    for keyword in {keyword for _, keyword, _ in tasks}:
+        cached_body(keyword)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        rewritten = [_rerender(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rewritten = list(pool.map(_rerender, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    rewritten = [path for path in rewritten if path]
+    print(f"✅ Re-rendered {len(rewritten)} of {len(tasks)} stale posts.")
+    return rewritten
 
 
 # --- MAIN EXECUTION ---
-def main():
-    keyword = random.choice(NICHES)
-    filename = f"{datetime.utcnow().strftime('%Y-%m-%d')}-{keyword.lower().replace(' ', '-')}.md"
-    filepath = os.path.join(CONTENT_DIR, filename)
+def generate(date: str = None, seed: str = DEFAULT_SEED, content_dir: str = CONTENT_DIR):
+    """Generate the post for `date` (YYYY-MM-DD, default today UTC); same seed + date → same bytes."""
+    date = date or datetime.utcnow().strftime("%Y-%m-%d")
+    keyword = pick_niche(date, seed)
+    filename = f"{date}-{slugify(keyword)}.md"
+    filepath = os.path.join(content_dir, filename)
 
     if os.path.exists(filepath):
         print("Today's article already exists:", filepath)
-        return
-
-    content = generate_article(keyword)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+        return None
 
+    os.makedirs(content_dir, exist_ok=True)
+    write_post(filepath, generate_article(keyword, f"{date} {PUBLISH_TIME}"))
     print(f"✅ Generated new detailed article: {filepath}")
 
+    # Feeds are secondary — a failure here must not lose the new post
+    try:
+        add_post(filepath)
+        print("✅ feed.xml and sitemap.xml updated.")
+    except Exception as e:
+        print(f"⚠️ Feed/sitemap update skipped: {e}")
+    return filepath
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate FullSend articles deterministically.")
+    parser.add_argument("--date", help="publish date YYYY-MM-DD (default: today, UTC)")
+    parser.add_argument("--seed", default=os.environ.get("DVOS_SEED", DEFAULT_SEED), help="niche selection seed")
+    parser.add_argument("--regenerate", action="store_true", help="re-render posts whose template changed")
+    parser.add_argument("--workers", type=int, default=0, help="parallel workers for --regenerate (0 = CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.regenerate:
+        regenerate(workers=args.workers)
+    else:
+        generate(args.date, args.seed)
+
 
 if __name__ == "__main__":
     main()
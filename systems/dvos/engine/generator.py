@@ -3,7 +3,7 @@
 
 import os
 from datetime import datetime
-from auto_healer import run_auto_healer, log_heal
+from engine.auto_healer import run_auto_healer, log_heal
 
 def generate_asset_variant(asset_id, style):
     """Simulate generating a variant asset."""
@@ -12,8 +12,11 @@ def generate_asset_variant(asset_id, style):
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
     # Placeholder: this is where you'd insert AI or rendering logic.
-    with open(path, "w") as f:
+    # Write + rename: an existing variant may be hardlinked into the blob store
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
         f.write("placeholder image data")
+    os.replace(tmp_path, path)
 
     log_heal(f"[GENERATED] {filename} created.")
     return path
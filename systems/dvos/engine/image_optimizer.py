@@ -0,0 +1,264 @@
+# DVOS Image Optimizer — Web Delivery Edition
+# Honors auto_optimize / web_optimized / resolution_target on asset descriptors
+# Resizes and re-encodes raster assets (progressive JPEG, optimized PNG, optional WebP)
+# Outputs are cached by source hash so only changed sources are reprocessed
+# Writes an output manifest to _data/ so layouts and includes serve the optimized files
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from engine.registry_loader import DVOSRegistry
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional — the stage is skipped without it
+    Image = None
+
+DVOS_ROOT = "systems/dvos"
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+MERGED_MAP_PATH = "systems/dvos/runtime/merged-asset-map.json"
+DEFAULT_OUTPUT_DIR = "assets/optimized"
+DEFAULT_CACHE_PATH = "systems/dvos/runtime/optimize-cache.json"
+DEFAULT_MANIFEST_PATH = "_data/optimized_images.json"
+RASTER_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Bump when encoder settings change so cached outputs are rebuilt
+ENCODER_VERSION = "1"
+
+
+# --- Shared Utility --------------------------------------------------------
+
+def log_event(message):
+    """Append image optimizer events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [OPTIMIZE] {message}\n")
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def resolve_asset_path(path):
+    """Resolve a descriptor path (DVOS-relative or repo-relative) to a file on disk."""
+    if not path:
+        return None
+    path = os.path.normpath(path).replace("\\", "/")
+    for candidate in (os.path.join(DVOS_ROOT, path), path):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def save_image(img, path, fmt, **params):
+    """Encode `img` to a temp file and rename it over `path`.
+
+    Outputs may be hardlinked to a blob (engine/blob_store.py); saving in place
+    would rewrite the shared inode, so every encode replaces the file instead.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        img.save(tmp_path, fmt, **params)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _write_json(data, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def parse_resolution_target(value):
+    """Parse a 'WIDTHxHEIGHT' target into an (int, int) tuple, or None."""
+    try:
+        width, height = str(value).lower().split("x")
+        return int(width), int(height)
+    except (AttributeError, ValueError):
+        return None
+
+
+# --- Descriptor Collection -------------------------------------------------
+
+def _read_assets(path):
+    """Read the 'assets' list from the merged asset map."""
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("assets", [])
+    except Exception as e:
+        log_event(f"[ERROR] Could not read assets from {path}: {e}")
+        return []
+
+
+def load_optimizable_assets():
+    """Collect raster descriptors flagged for optimization, keyed by resolved source path.
+
+    Only the analyzer's merged map is read: asset-map.json is the validation schema,
+    and its example entries do not describe files that exist on the site.
+    """
+    candidates = {}
+    for asset in _read_assets(MERGED_MAP_PATH):
+        if not asset.get("auto_optimize"):
+            continue
+        source = resolve_asset_path(asset.get("path"))
+        if not source or not source.lower().endswith(RASTER_EXTENSIONS):
+            continue
+        candidates[source] = asset
+    return candidates
+
+
+def asset_key(asset, source):
+    """Manifest key for an asset: its descriptor id, else the source file stem."""
+    return asset.get("id") or os.path.splitext(os.path.basename(source))[0]
+
+
+# --- Encoding Worker -------------------------------------------------------
+
+def optimize_image(source, output_base, target, settings):
+    """Resize one image to fit its target and write web-optimized encodings."""
+    outputs = []
+    with Image.open(source) as img:
+        if target:
+            img.thumbnail(target, Image.LANCZOS)  # never upscales
+
+        ext = os.path.splitext(source)[1].lower()
+        if ext in (".jpg", ".jpeg"):
+            path = output_base + ".jpg"
+            save_image(
+                img.convert("RGB"), path, "JPEG",
+                quality=settings.get("jpeg_quality", 82),
+                optimize=True,
+                progressive=True,
+            )
+        else:
+            path = output_base + ".png"
+            save_image(img, path, "PNG", optimize=True)
+        outputs.append(path)
+
+        if settings.get("webp", True):
+            path = output_base + ".webp"
+            save_image(img, path, "WEBP", quality=settings.get("webp_quality", 80), method=6)
+            outputs.append(path)
+
+    return outputs
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def load_cache(path):
+    """Load the source-hash cache manifest."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_cache(cache, path):
+    """Persist the source-hash cache manifest."""
+    _write_json(cache, path)
+
+
+def build_manifest(assets, cache):
+    """Map asset ids to their optimized outputs ({"source", "src", "webp"}) for Liquid."""
+    manifest = {}
+    for source, asset in assets.items():
+        outputs = cache.get(source, {}).get("outputs", [])
+        if not outputs:
+            continue
+        entry = {"source": source}
+        for path in outputs:
+            url = "/" + path.replace("\\", "/")
+            entry["webp" if path.endswith(".webp") else "src"] = url
+        manifest[asset_key(asset, source)] = entry
+    return manifest
+
+
+def write_manifest(manifest, path):
+    """Write the output manifest consumed by _layouts/default.html and _includes/dvos-visual.html."""
+    _write_json(manifest, path)
+
+
+def _is_fresh(entry, cache_key):
+    """True when a cache entry matches the key and all its outputs still exist."""
+    return (
+        entry is not None
+        and entry.get("key") == cache_key
+        and all(os.path.exists(p) for p in entry.get("outputs", []))
+    )
+
+
+def run_optimizer():
+    """Optimize every flagged raster asset whose source changed since the last run."""
+    if Image is None:
+        log_event("[WARN] Pillow not installed — image optimization skipped.")
+        print("[OPTIMIZE] Pillow not installed — skipping image optimization.")
+        return {"processed": 0, "cached": 0, "failed": 0, "skipped": True}
+
+    settings = DVOSRegistry.get_optimization()
+    output_dir = settings.get("output_dir", DEFAULT_OUTPUT_DIR)
+    cache_path = settings.get("cache_manifest", DEFAULT_CACHE_PATH)
+    manifest_path = settings.get("optimized_manifest", DEFAULT_MANIFEST_PATH)
+    cache = load_cache(cache_path)
+    os.makedirs(output_dir, exist_ok=True)
+
+    assets = load_optimizable_assets()
+    jobs = {}
+    cached = 0
+    for source, asset in assets.items():
+        target = parse_resolution_target(asset.get("resolution_target"))
+        cache_key = f"{file_digest(source)}:{asset.get('resolution_target', '')}:{ENCODER_VERSION}"
+        if _is_fresh(cache.get(source), cache_key):
+            cached += 1
+            continue
+        output_base = os.path.join(output_dir, asset_key(asset, source))
+        jobs[source] = (cache_key, output_base, target)
+
+    processed = failed = 0
+    if jobs:
+        workers = settings.get("workers") or None  # 0/None → one per CPU
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                source: pool.submit(optimize_image, source, output_base, target, settings)
+                for source, (_, output_base, target) in jobs.items()
+            }
+            for source, future in futures.items():
+                try:
+                    outputs = future.result()
+                except Exception as e:
+                    failed += 1
+                    log_event(f"[ERROR] Failed to optimize {source}: {e}")
+                    continue
+                processed += 1
+                cache[source] = {"key": jobs[source][0], "outputs": outputs}
+                log_event(f"Optimized {source} → {', '.join(outputs)}")
+        save_cache(cache, cache_path)
+
+    manifest = build_manifest(assets, cache)
+    if manifest != load_cache(manifest_path):
+        write_manifest(manifest, manifest_path)
+
+    msg = f"Image optimization complete — {processed} processed, {cached} cached, {failed} failed."
+    print(f"[OPTIMIZE] {msg}")
+    log_event(msg)
+    return {"processed": processed, "cached": cached, "failed": failed, "skipped": False}
+
+
+if __name__ == "__main__":
+    run_optimizer()
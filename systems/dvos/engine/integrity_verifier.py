@@ -1,10 +1,13 @@
 # DVOS Integrity Verifier
 # Ensures all assets in merged-asset-map.json are valid, unique, and present on disk.
 
-import json
 import os
 from datetime import datetime
 
+from engine.asset_records import AssetRecord, load_merged_records
+
+DVOS_ROOT = "systems/dvos"
+
 # --- Shared Log Bridge (consistent with analyzer/generator) -----------------
 
 def log_event(message, log_path="systems/dvos/runtime/logs/asset-sync.log"):
@@ -16,14 +19,36 @@ def log_event(message, log_path="systems/dvos/runtime/logs/asset-sync.log"):
 # --- Integrity Checks -------------------------------------------------------
 
 def load_merged_map(path="systems/dvos/runtime/merged-asset-map.json"):
-    """Load the merged asset map produced by analyzer."""
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Merged asset map not found at {path}")
-    with open(path, "r") as f:
-        return json.load(f)
+    """Load the merged asset map produced by analyzer (assets as compact AssetRecords)."""
+    return load_merged_records(path)
+
+def blob_resolver():
+    """Return a predicate telling whether a missing path is still backed by a stored blob."""
+    from engine.blob_store import get_config, has_blob, load_manifest
+
+    try:
+        config = get_config()
+        manifest = load_manifest(config["manifest"])
+    except Exception:
+        return lambda path: False
+    return lambda path: any(
+        has_blob(candidate, manifest, config["store"])
+        for candidate in (path, os.path.join(DVOS_ROOT, path))
+    )
+
+def asset_exists(asset_path, base_path="."):
+    """True when a descriptor path exists DVOS-relative (assets/...) or repo-relative (systems/dvos/...)."""
+    return any(
+        os.path.exists(os.path.join(base_path, candidate))
+        for candidate in (os.path.join(DVOS_ROOT, asset_path), asset_path)
+    )
 
 def check_assets(merged_data, base_path=".", log_path=None):
-    """Run a series of integrity checks on all assets."""
+    """Run a series of integrity checks on all assets.
+
+    A path missing on disk still counts as present when the blob store holds its content.
+    """
+    resolve_blob = None
     seen_ids = set()
     issues = {"missing_files": [], "duplicates": [], "invalid_entries": []}
 
@@ -32,7 +57,7 @@ def check_assets(merged_data, base_path=".", log_path=None):
         asset_path = asset.get("path")
 
         if not asset_id or not asset_path:
-            issues["invalid_entries"].append(asset)
+            issues["invalid_entries"].append(asset.to_dict() if isinstance(asset, AssetRecord) else asset)
             log_event(f"[INVALID] Missing ID or path in asset entry: {asset}", log_path)
             continue
 
@@ -44,8 +69,11 @@ def check_assets(merged_data, base_path=".", log_path=None):
             seen_ids.add(asset_id)
 
         # Check for missing physical files
-        full_path = os.path.join(base_path, asset_path)
-        if not os.path.exists(full_path):
+        if not asset_exists(asset_path, base_path):
+            resolve_blob = resolve_blob or blob_resolver()
+            if resolve_blob(asset_path):
+                log_event(f"[BLOB] {asset_id}: {asset_path} resolved from the blob store.", log_path)
+                continue
             issues["missing_files"].append(asset_path)
             log_event(f"[MISSING] File not found for {asset_id}: {asset_path}", log_path)
 
@@ -66,6 +94,17 @@ def summarize_issues(issues):
             lines.extend([f"    - {v}" for v in values])
     return "\n".join(lines)
 
+def verify_assets(merged_path="systems/dvos/runtime/merged-asset-map.json",
+                  log_path="systems/dvos/runtime/logs/asset-sync.log"):
+    """Cycle entry point — run integrity checks and summarize status for the scheduler."""
+    issues = check_assets(load_merged_map(merged_path), ".", log_path)
+    total = sum(len(values) for values in issues.values())
+    return {
+        **issues,
+        "status": "ok" if total == 0 else "issues",
+        "invalid": len(issues["invalid_entries"]),
+    }
+
 # --- Runtime Entry ----------------------------------------------------------
 
 def run_integrity_verifier():
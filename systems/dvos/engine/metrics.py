@@ -0,0 +1,200 @@
+# DVOS Metrics — Per-Stage Instrumentation
+# Collects stage wall time, scan volume, heal counts, webhook latency and git time
+# Exports each finished cycle to a Prometheus textfile-collector file and an in-memory ring buffer
+# Optional cProfile/tracemalloc hook dumps profiles for stages that exceed their time budget
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from engine.registry_loader import DVOSRegistry
+
+DEFAULT_TEXTFILE_PATH = "systems/dvos/runtime/metrics/dvos.prom"
+DEFAULT_PROFILE_DIR = "systems/dvos/runtime/profiles"
+DEFAULT_HISTORY_SIZE = 50
+
+# name → (prometheus type, help text)
+METRIC_HELP = {
+    "dvos_stage_duration_seconds": ("gauge", "Wall time of each stage in the last DVOS cycle."),
+    "dvos_files_scanned": ("gauge", "Descriptor files scanned in the last DVOS cycle."),
+    "dvos_bytes_read": ("gauge", "Descriptor bytes read in the last DVOS cycle."),
+    "dvos_assets_healed": ("gauge", "Repairs applied by the auto-healer in the last DVOS cycle."),
+    "dvos_webhook_latency_seconds": ("gauge", "Webhook request latency per destination in the last DVOS cycle."),
+    "dvos_git_duration_seconds": ("gauge", "Time spent in git subprocesses in the last DVOS cycle."),
+    "dvos_cycle_duration_seconds": ("gauge", "Wall time of the last DVOS cycle."),
+    "dvos_cycle_timestamp_seconds": ("gauge", "Unix time the last DVOS cycle finished."),
+    "dvos_cycles_total": ("counter", "DVOS cycles completed since the process started."),
+}
+
+_lock = threading.Lock()
+_values = {}          # (name, labels) → value for the cycle in progress
+_cycles_total = {}    # status → count (process lifetime)
+HISTORY = deque(maxlen=DEFAULT_HISTORY_SIZE)
+
+
+# --- Recording -------------------------------------------------------------
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name, amount=1, **labels):
+    """Add to a per-cycle metric."""
+    with _lock:
+        key = _key(name, labels)
+        _values[key] = _values.get(key, 0) + amount
+
+
+def observe(name, value, **labels):
+    """Set a per-cycle metric to the latest observed value."""
+    with _lock:
+        _values[_key(name, labels)] = value
+
+
+def get_config():
+    """Return the registry 'metrics' section (empty when the registry is unavailable)."""
+    try:
+        return DVOSRegistry.get_metrics()
+    except (FileNotFoundError, OSError):
+        return {}
+
+
+# --- Profiling Hook --------------------------------------------------------
+
+def _stage_budget(profiling, stage_name):
+    budgets = profiling.get("stage_budgets_s", {})
+    return budgets.get(stage_name, profiling.get("default_budget_s"))
+
+
+def _dump_profile(profiling, stage_name, elapsed, profiler, snapshot):
+    """Write cProfile stats (and tracemalloc top allocations) for an over-budget stage."""
+    output_dir = profiling.get("output_dir", DEFAULT_PROFILE_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    base = os.path.join(output_dir, f"{stamp}-{stage_name}")
+    profiler.dump_stats(base + ".prof")
+    if snapshot is not None:
+        with open(base + ".alloc.txt", "w") as f:
+            f.write(f"# {stage_name}: {elapsed:.3f}s (budget exceeded)\n")
+            for stat in snapshot.statistics("lineno")[: profiling.get("top_allocations", 25)]:
+                f.write(f"{stat}\n")
+    return base
+
+
+@contextmanager
+def stage(stage_name):
+    """Time a cycle stage; when profiling is enabled, dump profiles for over-budget stages."""
+    profiling = get_config().get("profiling", {})
+    profiler = None
+    started_tracing = False
+    if profiling.get("enabled"):
+        # Profilers are imported only when opted in, keeping cold starts light
+        import cProfile
+        import tracemalloc
+        profiler = cProfile.Profile()
+        if profiling.get("tracemalloc", True) and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        observe("dvos_stage_duration_seconds", elapsed, stage=stage_name)
+        if profiler is not None:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+            if started_tracing:
+                tracemalloc.stop()
+            budget = _stage_budget(profiling, stage_name)
+            if budget is not None and elapsed > budget:
+                _dump_profile(profiling, stage_name, elapsed, profiler, snapshot)
+
+
+# --- Export ----------------------------------------------------------------
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value):
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render_textfile(values, cycles_total):
+    """Render metric values in the Prometheus text exposition format."""
+    by_name = {}
+    for (name, labels), value in values.items():
+        by_name.setdefault(name, []).append((labels, value))
+    for status, count in cycles_total.items():
+        by_name.setdefault("dvos_cycles_total", []).append(((("status", status),), count))
+
+    lines = []
+    for name in sorted(by_name):
+        metric_type, help_text = METRIC_HELP.get(name, ("gauge", name))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(text, path):
+    """Atomically replace the textfile so the node exporter never reads a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def end_cycle(status, duration):
+    """Close out the current cycle: export the textfile, push a snapshot, reset values."""
+    config = get_config()
+    with _lock:
+        _values[_key("dvos_cycle_duration_seconds", {})] = duration
+        _values[_key("dvos_cycle_timestamp_seconds", {})] = time.time()
+        _cycles_total[status] = _cycles_total.get(status, 0) + 1
+        values = dict(_values)
+        cycles_total = dict(_cycles_total)
+        _values.clear()
+
+    snapshot = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "status": status,
+        "duration": duration,
+        "stages": {
+            dict(labels)["stage"]: value
+            for (name, labels), value in values.items()
+            if name == "dvos_stage_duration_seconds"
+        },
+        "metrics": {name + _format_labels(labels): value for (name, labels), value in values.items()},
+    }
+    global HISTORY
+    history_size = config.get("history_size", DEFAULT_HISTORY_SIZE)
+    with _lock:
+        if HISTORY.maxlen != history_size:
+            HISTORY = deque(HISTORY, maxlen=history_size)
+        HISTORY.append(snapshot)
+
+    textfile = config.get("textfile", DEFAULT_TEXTFILE_PATH)
+    if textfile:
+        write_textfile(render_textfile(values, cycles_total), textfile)
+    return snapshot
+
+
+def recent_cycles():
+    """Return the ring buffer of recent cycle snapshots, oldest first."""
+    with _lock:
+        return list(HISTORY)
@@ -0,0 +1,146 @@
+# DVOS Mismatch Scanner — Path-Keyed Pairing Detection
+# Walks the asset tree once and pairs binaries with descriptors by (relative dir, stem)
+# Pairing rules are configured per asset category (top-level folder) in registry.json
+# Results are compact frozensets that are diffed against the previous cycle's state
+
+import json
+import os
+
+ASSET_ROOT = "systems/dvos/assets"
+STATE_PATH = "systems/dvos/runtime/mismatch-state.json"
+
+# Used when runtime.pairing_rules is absent; categories without a rule are not paired
+DEFAULT_PAIRING_RULES = {
+    "ui": {"binary": ["svg"], "descriptor": "json", "require_descriptor": True, "require_binary": True},
+}
+
+
+# --- Scan ------------------------------------------------------------------
+
+def scan_asset_tree(asset_root=ASSET_ROOT):
+    """Single pass over the tree: {(rel_dir, stem): {ext, ...}} (dotfiles skipped)."""
+    entries = {}
+    stack = [(asset_root, "")]
+    while stack:
+        path, rel_dir = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{rel_dir}/{entry.name}" if rel_dir else entry.name))
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    if "asset-map" in stem or not ext:
+                        continue
+                    entries.setdefault((rel_dir, stem), set()).add(ext[1:].lower())
+        except FileNotFoundError:
+            continue
+    return entries
+
+
+# --- Pairing ---------------------------------------------------------------
+
+def _key(rel_dir, stem, ext):
+    return f"{rel_dir}/{stem}.{ext}" if rel_dir else f"{stem}.{ext}"
+
+
+def read_path_claim(asset_root, rel_dir, stem, descriptor_ext="json"):
+    """Return the asset-root-relative binary a differently named descriptor points at, if any."""
+    try:
+        with open(os.path.join(asset_root, rel_dir, f"{stem}.{descriptor_ext}"), "r") as f:
+            path = json.load(f).get("path", "")
+    except Exception:
+        return None
+    if not isinstance(path, str):
+        return None
+    path = path.replace("\\", "/")
+    for prefix in ("systems/dvos/", "assets/"):
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+    return path or None
+
+
+def pair_entries(entries, rules, asset_root=None):
+    """Apply per-category rules; return (missing_descriptor, missing_binary, totals).
+
+    With `asset_root`, descriptors that have no same-stem binary (e.g. logo.json
+    describing fullsend-logo.png) are opened once and paired through their "path".
+    """
+    unpaired_binaries = {}
+    orphan_descriptors = []
+    totals = {"binaries": 0, "descriptors": 0}
+
+    for (rel_dir, stem), exts in entries.items():
+        rule = rules.get(rel_dir.split("/")[0])
+        if rule is None:
+            continue
+        descriptor_ext = rule.get("descriptor", "json")
+        binaries = [ext for ext in rule.get("binary", []) if ext in exts]
+        has_descriptor = descriptor_ext in exts
+        totals["binaries"] += len(binaries)
+        totals["descriptors"] += int(has_descriptor)
+
+        if binaries and not has_descriptor and rule.get("require_descriptor", True):
+            # Keyed by the binary so the healer can point the new descriptor at it
+            unpaired_binaries[_key(rel_dir, stem, binaries[0])] = (rel_dir, stem)
+        elif has_descriptor and not binaries:
+            orphan_descriptors.append((rel_dir, stem, rule))
+
+    claimed = set()
+    missing_binary = set()
+    for rel_dir, stem, rule in orphan_descriptors:
+        claim = read_path_claim(asset_root, rel_dir, stem, rule.get("descriptor", "json")) if asset_root else None
+        if claim:
+            claim_dir, claim_name = os.path.split(claim)
+            claim_stem, claim_ext = os.path.splitext(claim_name)
+            if claim_ext[1:].lower() in entries.get((claim_dir, claim_stem), ()):
+                claimed.add(claim)
+                continue
+        if rule.get("require_binary", False):
+            missing_binary.add(_key(rel_dir, stem, rule["binary"][0]))
+
+    missing_descriptor = {key for key in unpaired_binaries if key not in claimed}
+    return frozenset(missing_descriptor), frozenset(missing_binary), totals
+
+
+# --- Cycle-to-Cycle State --------------------------------------------------
+
+def load_state(path=STATE_PATH):
+    """Load the mismatch sets recorded after the previous cycle."""
+    if not os.path.exists(path):
+        return {"missing_json": frozenset(), "missing_binary": frozenset()}
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except Exception:
+        data = {}
+    return {kind: frozenset(data.get(kind, [])) for kind in ("missing_json", "missing_binary")}
+
+
+def save_state(report, path=None):
+    """Persist this cycle's mismatch sets (call once they have been handled)."""
+    path = path or report.get("state_path", STATE_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({kind: sorted(report[kind]) for kind in ("missing_json", "missing_binary")}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def detect_mismatches(rules=None, asset_root=ASSET_ROOT, state_path=STATE_PATH):
+    """Scan once, pair by path and diff against the previous cycle's mismatch sets."""
+    rules = rules or DEFAULT_PAIRING_RULES
+    missing_json, missing_binary, totals = pair_entries(scan_asset_tree(asset_root), rules, asset_root)
+    previous = load_state(state_path)
+    return {
+        "missing_json": missing_json,
+        "missing_binary": missing_binary,
+        "new_missing_json": missing_json - previous["missing_json"],
+        "new_missing_binary": missing_binary - previous["missing_binary"],
+        "resolved": (previous["missing_json"] - missing_json) | (previous["missing_binary"] - missing_binary),
+        "total_binaries": totals["binaries"],
+        "total_descriptors": totals["descriptors"],
+        "state_path": state_path,
+    }
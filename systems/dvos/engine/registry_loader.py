@@ -72,6 +72,22 @@ class DVOSRegistry:
     def get_metadata(cls):
         return cls.load().get("metadata", {})
 
+    @classmethod
+    def get_optimization(cls):
+        return cls.load().get("optimization", {})
+
+    @classmethod
+    def get_metrics(cls):
+        return cls.load().get("metrics", {})
+
+    @classmethod
+    def get_blobs(cls):
+        return cls.load().get("blobs", {})
+
+    @classmethod
+    def get_feeds(cls):
+        return cls.load().get("feeds", {})
+
     @classmethod
     def get_asset_sources(cls):
         return cls.load().get("asset_sources", [])
@@ -0,0 +1,168 @@
+# DVOS Responsive Images — Derivative Set Builder
+# Produces width derivatives (e.g. 480/960/1920) for every optimizable raster asset
+# Writes a srcset manifest to _data/ so layouts can emit responsive <img> markup
+# Derivatives are built lazily: only when the source or the width set changes
+# The manifest is committed, so it holds content data only; stat data lives in runtime/
+
+import json
+import os
+
+from engine.registry_loader import DVOSRegistry
+from engine.image_optimizer import (
+    Image,
+    file_digest,
+    load_optimizable_assets,
+    log_event,
+    save_image,
+)
+
+DEFAULT_WIDTHS = [480, 960, 1920]
+DEFAULT_OUTPUT_DIR = "assets/responsive"
+DEFAULT_MANIFEST_PATH = "_data/responsive_images.json"
+DEFAULT_STAT_CACHE_PATH = "systems/dvos/runtime/responsive-stat-cache.json"
+
+
+# --- Manifest Helpers ------------------------------------------------------
+
+def load_manifest(path):
+    """Load the existing srcset manifest (empty when absent or unreadable)."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def write_manifest(manifest, path):
+    """Write a JSON manifest (srcset manifest or stat cache) via temp file + rename."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def source_fingerprint(source, stat_cache):
+    """Return the source sha256, reusing the cached hash while size and mtime are unchanged."""
+    stat = os.stat(source)
+    cached = stat_cache.get(source)
+    if cached and cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns:
+        return cached["source_hash"]
+    source_hash = file_digest(source)
+    stat_cache[source] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "source_hash": source_hash}
+    return source_hash
+
+
+def plan_widths(source_width, widths):
+    """Pick derivative widths that do not upscale, capping the set at the source width."""
+    usable = {w for w in widths if w <= source_width}
+    if len(usable) < len(set(widths)):
+        usable.add(source_width)
+    return sorted(usable)
+
+
+# --- Derivative Builder ----------------------------------------------------
+
+def build_derivative(source, width, output_path, jpeg_quality=82):
+    """Resize a source image to the given width (aspect preserved) and save it."""
+    with Image.open(source) as img:
+        height = max(1, round(img.height * width / img.width))
+        resized = img.resize((width, height), Image.LANCZOS) if width != img.width else img.copy()
+        if output_path.lower().endswith((".jpg", ".jpeg")):
+            save_image(resized.convert("RGB"), output_path, "JPEG", quality=jpeg_quality,
+                       optimize=True, progressive=True)
+        else:
+            save_image(resized, output_path, "PNG", optimize=True)
+    return width, height
+
+
+def build_asset_set(asset_id, source, widths, output_dir, previous=None, stat_cache=None, jpeg_quality=82):
+    """Build (or reuse) the derivative set for one asset and return its manifest entry."""
+    source_hash = source_fingerprint(source, {} if stat_cache is None else stat_cache)
+    ext = os.path.splitext(source)[1].lower()
+
+    with Image.open(source) as img:
+        source_width, source_height = img.size
+    planned = plan_widths(source_width, widths)
+
+    unchanged_source = previous is not None and previous.get("source_hash") == source_hash
+    reusable = {d["width"]: d for d in previous.get("srcset", [])} if unchanged_source else {}
+
+    srcset = []
+    built = 0
+    for width in planned:
+        path = os.path.join(output_dir, f"{asset_id}-{width}w{ext}")
+        existing = reusable.get(width)
+        if existing and os.path.exists(existing["path"].lstrip("/")):
+            srcset.append(existing)
+            continue
+        os.makedirs(output_dir, exist_ok=True)
+        _, height = build_derivative(source, width, path, jpeg_quality)
+        srcset.append({"path": "/" + path.replace("\\", "/"), "width": width, "height": height})
+        built += 1
+
+    largest = srcset[-1]
+    entry = {
+        "source": source,
+        "source_hash": source_hash,
+        "width": source_width,
+        "height": source_height,
+        "src": largest["path"],
+        "srcset": srcset,
+    }
+    return entry, built
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def run_responsive_images():
+    """Refresh derivative sets for every optimizable raster asset and rewrite the manifest."""
+    if Image is None:
+        log_event("[WARN] Pillow not installed — responsive derivatives skipped.")
+        print("[RESPONSIVE] Pillow not installed — skipping derivative generation.")
+        return {"assets": 0, "built": 0, "skipped": True}
+
+    settings = DVOSRegistry.get_optimization()
+    widths = settings.get("responsive_widths", DEFAULT_WIDTHS)
+    output_dir = settings.get("responsive_output_dir", DEFAULT_OUTPUT_DIR)
+    manifest_path = settings.get("responsive_manifest", DEFAULT_MANIFEST_PATH)
+    stat_cache_path = settings.get("responsive_stat_cache", DEFAULT_STAT_CACHE_PATH)
+    jpeg_quality = settings.get("jpeg_quality", 82)
+
+    previous_manifest = load_manifest(manifest_path)
+    stat_cache = load_manifest(stat_cache_path)
+    previous_stats = dict(stat_cache)
+    manifest = {}
+    built_total = 0
+
+    for source, asset in load_optimizable_assets().items():
+        asset_id = asset.get("id") or os.path.splitext(os.path.basename(source))[0]
+        try:
+            entry, built = build_asset_set(
+                asset_id, source, widths, output_dir, previous_manifest.get(asset_id), stat_cache, jpeg_quality
+            )
+        except Exception as e:
+            log_event(f"[ERROR] Failed to build derivatives for {asset_id}: {e}")
+            if asset_id in previous_manifest:
+                manifest[asset_id] = previous_manifest[asset_id]
+            continue
+        manifest[asset_id] = entry
+        built_total += built
+        if built:
+            log_event(f"Built {built} responsive derivatives for {asset_id}.")
+
+    if manifest != previous_manifest:
+        write_manifest(manifest, manifest_path)
+    if stat_cache != previous_stats:
+        write_manifest(stat_cache, stat_cache_path)
+
+    msg = f"Responsive images ready — {len(manifest)} assets, {built_total} derivatives rebuilt."
+    print(f"[RESPONSIVE] {msg}")
+    log_event(msg)
+    return {"assets": len(manifest), "built": built_total, "skipped": False}
+
+
+if __name__ == "__main__":
+    run_responsive_images()
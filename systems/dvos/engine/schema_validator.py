@@ -0,0 +1,217 @@
+# DVOS Schema Validator — Compiled Descriptor Checks
+# Compiles runtime.validation_schema (schema/asset-map.json) once into checker functions
+# Validates each descriptor as the analyzer parses it, reporting per-field errors
+# Results are cached per descriptor hash so unchanged descriptors are never revalidated
+
+import hashlib
+import json
+import os
+import re
+
+DVOS_ROOT = "systems/dvos"
+DEFAULT_SCHEMA_PATH = "schema/asset-map.json"
+CACHE_PATH = "systems/dvos/runtime/validation-cache.json"
+
+# An example catalog can only make these fields required; every other field it shows is type-checked
+EXAMPLE_REQUIRED_FIELDS = ("id", "path")
+
+# Format rules for well-known descriptor fields (applied when the field is present)
+FIELD_FORMATS = {
+    "id": re.compile(r"^[a-z0-9][a-z0-9-]*$"),
+    "version": re.compile(r"^\d+(\.\d+)*$"),
+    "resolution_target": re.compile(r"^\d+x\d+$"),
+    "last_updated": re.compile(r"^\d{4}-\d{2}-\d{2}"),
+}
+
+JSON_TYPES = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+    "array": list,
+    "object": dict,
+}
+
+
+# --- Schema Compilation ----------------------------------------------------
+
+def resolve_schema_path(path):
+    """Resolve a schema path given relative to the DVOS root or the repo root."""
+    for candidate in (os.path.join(DVOS_ROOT, path), path):
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(f"Validation schema not found at {path}")
+
+
+def _rules_from_examples(assets):
+    """Derive required fields (id/path) and field types from the example catalog in asset-map.json.
+
+    Fields the examples merely share (description, auto_optimize, ...) stay optional:
+    real descriptors are not required to carry the catalog's full metadata.
+    """
+    field_types = {}
+    field_counts = {}
+    for asset in assets:
+        for field, value in asset.items():
+            field_types.setdefault(field, set()).add(type(value))
+            field_counts[field] = field_counts.get(field, 0) + 1
+    required = [f for f in EXAMPLE_REQUIRED_FIELDS if assets and field_counts.get(f) == len(assets)]
+    types = {f: tuple(t) for f, t in field_types.items()}
+    return required, types, {}
+
+
+def _rules_from_json_schema(schema):
+    """Read required fields, types and patterns from a JSON-Schema style object."""
+    properties = schema.get("properties", {})
+    types = {
+        field: JSON_TYPES[spec["type"]]
+        for field, spec in properties.items()
+        if spec.get("type") in JSON_TYPES
+    }
+    patterns = {
+        field: re.compile(spec["pattern"])
+        for field, spec in properties.items()
+        if "pattern" in spec
+    }
+    return schema.get("required", []), types, patterns
+
+
+def _type_names(expected):
+    return "/".join(sorted(t.__name__ for t in expected))
+
+
+def _type_checker(field, expected):
+    expected = expected if isinstance(expected, tuple) else (expected,)
+
+    def check(asset):
+        if field not in asset:
+            return None
+        value = asset[field]
+        # bool is an int subclass — don't let true/false satisfy a numeric field
+        if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+            return f"expected {_type_names(expected)}, got {type(value).__name__}"
+        return None
+    return check
+
+
+def _required_checker(field):
+    def check(asset):
+        if asset.get(field) in (None, ""):
+            return "required field is missing"
+        return None
+    return check
+
+
+def _pattern_checker(field, pattern):
+    def check(asset):
+        value = asset.get(field)
+        if isinstance(value, str) and not pattern.match(value):
+            return f"'{value}' does not match {pattern.pattern}"
+        return None
+    return check
+
+
+def compile_schema(schema):
+    """Compile a schema document into a list of (field, checker) pairs."""
+    if "properties" in schema:
+        required, types, patterns = _rules_from_json_schema(schema)
+    else:
+        required, types, patterns = _rules_from_examples(schema.get("assets", []))
+
+    checkers = [(field, _required_checker(field)) for field in required]
+    checkers += [(field, _type_checker(field, expected)) for field, expected in types.items()]
+    for field, pattern in {**FIELD_FORMATS, **patterns}.items():
+        checkers.append((field, _pattern_checker(field, pattern)))
+    return checkers
+
+
+# --- Validator -------------------------------------------------------------
+
+class DescriptorValidator:
+    """Validates descriptors against a compiled schema with a per-hash result cache."""
+
+    def __init__(self, schema_path=DEFAULT_SCHEMA_PATH, cache_path=CACHE_PATH):
+        resolved = resolve_schema_path(schema_path)
+        with open(resolved, "rb") as f:
+            raw_schema = f.read()
+        self.schema_hash = hashlib.sha1(raw_schema).hexdigest()
+        self.checkers = compile_schema(json.loads(raw_schema))
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        # A schema change invalidates every cached result
+        if data.get("schema_hash") != self.schema_hash:
+            return {}
+        return data.get("results", {})
+
+    def save_cache(self):
+        """Persist cached results (no-op when nothing new was validated)."""
+        if not self.cache_path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"schema_hash": self.schema_hash, "results": self.cache}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def check(self, asset):
+        """Run every compiled checker and return {field: [errors]} (empty when valid)."""
+        if not isinstance(asset, dict):
+            return {"<root>": ["descriptor must be a JSON object"]}
+        errors = {}
+        for field, checker in self.checkers:
+            error = checker(asset)
+            if error:
+                errors.setdefault(field, []).append(error)
+        return errors
+
+    def validate(self, raw_bytes, asset):
+        """Validate a parsed descriptor, reusing the cached result for identical bytes."""
+        digest = hashlib.sha1(raw_bytes).hexdigest()
+        cached = self.cache.get(digest)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        errors = self.check(asset)
+        self.cache[digest] = errors
+        self._dirty = True
+        return errors
+
+
+# Compiled validators stay warm for the life of the process (e.g. the daemon)
+_validators = {}
+
+
+def get_validator(schema_path=DEFAULT_SCHEMA_PATH):
+    """Return a compiled validator, recompiling only when the schema file changes."""
+    resolved = resolve_schema_path(schema_path)
+    key = (resolved, os.stat(resolved).st_mtime_ns)
+    validator = _validators.get(resolved)
+    if validator is None or validator.key != key:
+        validator = DescriptorValidator(schema_path)
+        validator.key = key
+        _validators[resolved] = validator
+    return validator
+
+
+def reset_validators():
+    """Drop compiled validators so the next scan recompiles from disk."""
+    _validators.clear()
+
+
+def format_errors(errors):
+    """Flatten per-field errors into a single log-friendly string."""
+    return "; ".join(f"{field}: {', '.join(messages)}" for field, messages in errors.items())
@@ -0,0 +1,386 @@
+# DVOS Site Feeds — Streaming Atom Feed + Sitemap Builder
+# Reads only the front matter of each _posts file (bodies are never loaded)
+# Keeps the newest N posts in a bounded heap for feed.xml and streams every URL into
+# sitemap.xml, rolling over to sitemap-N.xml chunks + a sitemap index past 50k URLs
+# add_post() updates both outputs incrementally, resuming from the committed feed.xml and
+# sitemap files themselves (no re-read of _posts, no runtime state needed on a fresh checkout)
+#
+# CLI (from the repo root):
+#   python -m systems.dvos feeds            (full rebuild)
+
+import heapq
+import os
+from datetime import datetime
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from engine.registry_loader import DVOSRegistry
+
+LOG_PATH = "systems/dvos/runtime/logs/asset-sync.log"
+SITE_CONFIG_PATH = "_config.yml"
+DEFAULT_FEEDS = {
+    "posts_dir": "_posts",
+    "feed_path": "feed.xml",
+    "sitemap_path": "sitemap.xml",
+    "feed_entries": 20,
+    "sitemap_chunk": 50000,
+}
+URLSET_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = "</urlset>\n"
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def log_event(message):
+    """Append feed builder events to the runtime log."""
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        log.write(f"[{datetime.utcnow().isoformat()}Z] [FEEDS] {message}\n")
+
+
+def get_config():
+    """Feed settings from the registry, with defaults."""
+    return {**DEFAULT_FEEDS, **DVOSRegistry.get_feeds()}
+
+
+# --- Front Matter ----------------------------------------------------------
+
+def _scalar(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value.startswith("[") and value.endswith("]"):
+        return [_scalar(v) for v in value[1:-1].split(",") if v.strip()]
+    return value
+
+
+def read_front_matter(path):
+    """Read the leading `---` block of a post (flat key: value pairs only)."""
+    data = {}
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return data
+        for line in f:
+            if line.strip() == "---":
+                break
+            if ":" in line and not line[0].isspace():
+                key, value = line.split(":", 1)
+                data[key.strip()] = _scalar(value)
+    return data
+
+
+def read_site_config(path=SITE_CONFIG_PATH):
+    """Top-level scalars from _config.yml (url, baseurl, title, description, author)."""
+    config = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line[:1].isalpha() and ":" in line:
+                    key, value = line.split("#", 1)[0].split(":", 1)
+                    if value.strip():
+                        config[key.strip()] = _scalar(value)
+    return config
+
+
+# --- Posts -----------------------------------------------------------------
+
+def parse_post_date(value, filename):
+    """Front matter date, falling back to the YYYY-MM-DD filename prefix."""
+    for candidate, fmt in ((str(value or "")[:19], "%Y-%m-%d %H:%M:%S"), (str(value or "")[:10], "%Y-%m-%d"),
+                           (filename[:10], "%Y-%m-%d")):
+        try:
+            return datetime.strptime(candidate, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def post_url(filename, front_matter, date, site):
+    """Absolute URL using Jekyll's default `date` permalink (or the post's own permalink)."""
+    base = site.get("url", "").rstrip("/") + site.get("baseurl", "").rstrip("/")
+    if front_matter.get("permalink"):
+        return base + "/" + front_matter["permalink"].lstrip("/")
+    slug = os.path.splitext(filename)[0][11:]
+    categories = front_matter.get("categories") or front_matter.get("category") or []
+    if isinstance(categories, str):
+        categories = categories.split()
+    prefix = "".join(f"/{c}" for c in categories)
+    return f"{base}{prefix}/{date:%Y/%m/%d}/{slug}.html"
+
+
+def post_entry(path, site):
+    """Compact feed/sitemap record for one post (front matter only)."""
+    filename = os.path.basename(path)
+    front_matter = read_front_matter(path)
+    date = parse_post_date(front_matter.get("date"), filename)
+    if date is None or front_matter.get("published") == "false":
+        return None
+    return {
+        "file": filename,
+        "url": post_url(filename, front_matter, date, site),
+        "title": front_matter.get("title", filename),
+        "summary": front_matter.get("description", ""),
+        "date": date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def iter_post_entries(posts_dir, site):
+    """Stream entries in filename (date) order; one front matter block in memory at a time."""
+    if not os.path.isdir(posts_dir):
+        return
+    for filename in sorted(f for f in os.listdir(posts_dir) if f.endswith((".md", ".markdown", ".html"))):
+        entry = post_entry(os.path.join(posts_dir, filename), site)
+        if entry is not None:
+            yield entry
+
+
+# --- Writers ---------------------------------------------------------------
+
+def _atomic_write(path, content):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_feed(entries, site, path):
+    """Write an Atom feed for `entries` (newest first)."""
+    base = site.get("url", "").rstrip("/") + site.get("baseurl", "").rstrip("/")
+    updated = entries[0]["date"] if entries else datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n',
+        f"  <title>{escape(site.get('title', ''))}</title>\n",
+        f"  <subtitle>{escape(site.get('description', ''))}</subtitle>\n",
+        f'  <link href="{escape(base)}/feed.xml" rel="self" type="application/atom+xml"/>\n',
+        f'  <link href="{escape(base)}/" rel="alternate" type="text/html"/>\n',
+        f"  <id>{escape(base)}/feed.xml</id>\n",
+        f"  <updated>{updated}</updated>\n",
+        f"  <author><name>{escape(site.get('author', ''))}</name></author>\n",
+    ]
+    for entry in entries:
+        parts.append(
+            "  <entry>\n"
+            f"    <title>{escape(entry['title'])}</title>\n"
+            f'    <link href="{escape(entry["url"])}" rel="alternate" type="text/html"/>\n'
+            f"    <id>{escape(entry['url'])}</id>\n"
+            f"    <published>{entry['date']}</published>\n"
+            f"    <updated>{entry['date']}</updated>\n"
+            f"    <summary>{escape(entry['summary'])}</summary>\n"
+            "  </entry>\n"
+        )
+    parts.append("</feed>\n")
+    _atomic_write(path, "".join(parts))
+
+
+def _url_element(url, lastmod):
+    return f"  <url>\n    <loc>{escape(url)}</loc>\n    <lastmod>{lastmod}</lastmod>\n  </url>\n"
+
+
+def chunk_path(sitemap_path, index):
+    root, ext = os.path.splitext(sitemap_path)
+    return f"{root}-{index}{ext}"
+
+
+def write_sitemap_index(sitemap_path, chunks, site):
+    """Point sitemap.xml at sitemap-1..N.xml."""
+    base = site.get("url", "").rstrip("/") + site.get("baseurl", "").rstrip("/")
+    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for i in range(1, chunks + 1):
+        name = os.path.basename(chunk_path(sitemap_path, i))
+        parts.append(f"  <sitemap>\n    <loc>{escape(base)}/{name}</loc>\n    <lastmod>{now}</lastmod>\n  </sitemap>\n")
+    parts.append("</sitemapindex>\n")
+    _atomic_write(sitemap_path, "".join(parts))
+
+
+class SitemapWriter:
+    """Stream <url> elements into chunk files of at most `chunk_size` URLs."""
+
+    def __init__(self, sitemap_path, chunk_size):
+        self.sitemap_path = sitemap_path
+        self.chunk_size = chunk_size
+        self.chunks = 0
+        self.count = 0
+        self._file = None
+
+    def add(self, url, lastmod):
+        if self._file is None or self.count >= self.chunk_size:
+            self._roll()
+        self._file.write(_url_element(url, lastmod))
+        self.count += 1
+
+    def _roll(self):
+        if self._file is not None:
+            self._file.write(URLSET_CLOSE)
+            self._file.close()
+        self.chunks += 1
+        self.count = 0
+        path = chunk_path(self.sitemap_path, self.chunks) + ".tmp"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(URLSET_OPEN)
+
+    def close(self, site):
+        """Finish the last chunk; a single chunk becomes sitemap.xml itself."""
+        if self._file is None:
+            self._roll()
+        self._file.write(URLSET_CLOSE)
+        self._file.close()
+        self._file = None
+        if self.chunks == 1:
+            os.replace(chunk_path(self.sitemap_path, 1) + ".tmp", self.sitemap_path)
+        else:
+            for i in range(1, self.chunks + 1):
+                os.replace(chunk_path(self.sitemap_path, i) + ".tmp", chunk_path(self.sitemap_path, i))
+            write_sitemap_index(self.sitemap_path, self.chunks, site)
+        _remove_stale_chunks(self.sitemap_path, self.chunks if self.chunks > 1 else 0)
+
+
+def _remove_stale_chunks(sitemap_path, keep):
+    """Delete sitemap-N.xml files beyond the current chunk count."""
+    i = keep + 1
+    while os.path.exists(chunk_path(sitemap_path, i)):
+        os.unlink(chunk_path(sitemap_path, i))
+        i += 1
+
+
+# --- State -----------------------------------------------------------------
+
+def read_feed(path):
+    """Return (feed id, entries) from a feed.xml written by write_feed, or None."""
+    try:
+        root = ElementTree.parse(path).getroot()
+    except (OSError, ElementTree.ParseError):
+        return None
+    entries = [
+        {
+            "url": node.findtext(f"{ATOM}id", ""),
+            "title": node.findtext(f"{ATOM}title", ""),
+            "summary": node.findtext(f"{ATOM}summary", ""),
+            "date": node.findtext(f"{ATOM}published", ""),
+        }
+        for node in root.iter(f"{ATOM}entry")
+    ]
+    return root.findtext(f"{ATOM}id", ""), entries
+
+
+def count_sitemap_urls(path):
+    """Count <url> elements in a urlset file (streamed); None for an index or a damaged file."""
+    count = 0
+    last = ""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("<sitemapindex"):
+                    return None
+                if line == "  <url>\n":
+                    count += 1
+                last = line
+    except OSError:
+        return None
+    return count if last == URLSET_CLOSE else None
+
+
+def derive_state(site, config):
+    """Rebuild the incremental state from the committed outputs; None when they do not match config."""
+    base = site.get("url", "").rstrip("/") + site.get("baseurl", "").rstrip("/")
+    feed = read_feed(config["feed_path"])
+    if feed is None or feed[0] != f"{base}/feed.xml":
+        return None
+
+    sitemap_path = config["sitemap_path"]
+    chunk_size = int(config["sitemap_chunk"])
+    chunks = 1
+    last_count = count_sitemap_urls(sitemap_path)
+    if last_count is None:
+        # sitemap.xml is an index: every chunk but the last one is full by construction
+        chunks = 0
+        while os.path.exists(chunk_path(sitemap_path, chunks + 1)):
+            chunks += 1
+        if chunks < 2 or count_sitemap_urls(chunk_path(sitemap_path, 1)) != chunk_size:
+            return None
+        last_count = count_sitemap_urls(chunk_path(sitemap_path, chunks))
+    if not last_count or last_count > chunk_size:
+        return None
+
+    posts = (chunks - 1) * chunk_size + last_count - 1  # the home page URL is not a post
+    if len(feed[1]) != min(int(config["feed_entries"]), posts):
+        return None
+    return {"posts": posts, "chunks": chunks, "last_chunk_count": last_count, "feed": feed[1]}
+
+
+# --- Runtime Entry ---------------------------------------------------------
+
+def build_feeds(config=None):
+    """Full rebuild: one streaming pass over _posts for both outputs."""
+    config = config or get_config()
+    site = read_site_config()
+    limit = int(config["feed_entries"])
+    newest = []  # min-heap of (date, file, entry), bounded to `limit`
+    writer = SitemapWriter(config["sitemap_path"], int(config["sitemap_chunk"]))
+    base = site.get("url", "").rstrip("/") + site.get("baseurl", "").rstrip("/")
+    writer.add(f"{base}/", datetime.utcnow().strftime("%Y-%m-%d"))
+
+    posts = 0
+    for entry in iter_post_entries(config["posts_dir"], site):
+        writer.add(entry["url"], entry["date"][:10])
+        item = (entry["date"], entry["url"], entry)
+        if len(newest) < limit:
+            heapq.heappush(newest, item)
+        elif item > newest[0]:
+            heapq.heapreplace(newest, item)
+        posts += 1
+    writer.close(site)
+
+    entries = [item[2] for item in sorted(newest, key=lambda i: i[:2], reverse=True)]
+    write_feed(entries, site, config["feed_path"])
+    log_event(f"Feeds rebuilt — {posts} posts, {len(entries)} feed entries, {writer.chunks} sitemap chunk(s).")
+    return {"posts": posts, "feed_entries": len(entries), "sitemap_chunks": writer.chunks}
+
+
+def _append_to_sitemap(path, element):
+    """Insert one <url> before the closing </urlset> (temp file + rename, never edited in place)."""
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    if not content.endswith(URLSET_CLOSE):
+        raise ValueError(f"{path} does not end with </urlset>")
+    _atomic_write(path, content[:-len(URLSET_CLOSE)] + element + URLSET_CLOSE)
+
+
+def add_post(post_path, config=None):
+    """Incrementally add one new post to feed.xml and the sitemap (full rebuild if they do not match config)."""
+    config = config or get_config()
+    site = read_site_config()
+    state = derive_state(site, config)
+    if state is None:
+        return build_feeds(config)
+
+    entry = post_entry(post_path, site)
+    if entry is None or any(e["url"] == entry["url"] for e in state["feed"]):
+        return {"posts": state["posts"], "feed_entries": len(state["feed"]), "sitemap_chunks": state["chunks"]}
+
+    feed = sorted(state["feed"] + [entry], key=lambda e: (e["date"], e["url"]), reverse=True)
+    state["feed"] = feed[:int(config["feed_entries"])]
+    write_feed(state["feed"], site, config["feed_path"])
+
+    sitemap_path = config["sitemap_path"]
+    element = _url_element(entry["url"], entry["date"][:10])
+    if state["last_chunk_count"] < int(config["sitemap_chunk"]):
+        target = sitemap_path if state["chunks"] == 1 else chunk_path(sitemap_path, state["chunks"])
+        _append_to_sitemap(target, element)
+        state["last_chunk_count"] += 1
+    else:
+        if state["chunks"] == 1:
+            os.replace(sitemap_path, chunk_path(sitemap_path, 1))
+        state["chunks"] += 1
+        _atomic_write(chunk_path(sitemap_path, state["chunks"]), URLSET_OPEN + element + URLSET_CLOSE)
+        state["last_chunk_count"] = 1
+        write_sitemap_index(sitemap_path, state["chunks"], site)
+
+    state["posts"] += 1
+    log_event(f"Feeds updated incrementally with {entry['file']}.")
+    return {"posts": state["posts"], "feed_entries": len(state["feed"]), "sitemap_chunks": state["chunks"]}
+
+
+if __name__ == "__main__":
+    print(f"[FEEDS] {build_feeds()}")
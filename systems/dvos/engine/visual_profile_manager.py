@@ -6,6 +6,7 @@ import json
 import os
 from datetime import datetime
 from systems.dvos.engine.registry_loader import DVOSRegistry
+from engine.asset_records import AssetRecord
 
 ASSET_BASE_PATH = "systems/dvos/assets/"
 PROFILE_CACHE_PATH = "systems/dvos/runtime/visual-profile.json"
@@ -49,7 +50,7 @@ def load_visual_profile():
                         with open(os.path.join(root, file), "r") as f:
                             data = json.load(f)
                             data["path"] = os.path.normpath(data.get("path", "")).replace("\\", "/")
-                            assets.append(data)
+                            assets.append(AssetRecord(data))
                     except Exception as e:
                         log_visual_event(f"[ERROR] Failed to load asset {file}: {e}")
 
@@ -68,8 +69,10 @@ def load_visual_profile():
                 break
 
     os.makedirs(os.path.dirname(PROFILE_CACHE_PATH), exist_ok=True)
-    with open(PROFILE_CACHE_PATH, "w") as f:
+    tmp_path = f"{PROFILE_CACHE_PATH}.tmp"
+    with open(tmp_path, "w") as f:
         json.dump(visual_context, f, indent=2)
+    os.replace(tmp_path, PROFILE_CACHE_PATH)
 
     log_visual_event(f"Loaded visual profile: {profile_name}")
     return visual_context
@@ -0,0 +1,36 @@
+# DVOS Tests — Shared Fixtures
+# Every test runs inside a throwaway synthetic repo root (see benchmarks/synthetic_tree.py)
+# so engine modules resolve their repo-root-relative paths against it
+#
+# Usage (from the repo root):
+#   python -m pytest -q systems/dvos/tests
+
+import os
+import sys
+
+import pytest
+
+DVOS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPO_ROOT = os.path.abspath(os.path.join(DVOS_DIR, "..", ".."))
+for path in (os.path.join(DVOS_DIR, "benchmarks"), DVOS_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from synthetic_tree import build_synthetic_root  # noqa: E402
+
+
+def _reload_registries():
+    """Drop cached registry data (the loader is importable under two module names)."""
+    from engine.registry_loader import DVOSRegistry
+    from systems.dvos.engine.registry_loader import DVOSRegistry as PackageRegistry
+    for registry in (DVOSRegistry, PackageRegistry):
+        registry.load(force_reload=True)
+
+
+@pytest.fixture
+def synthetic_root(tmp_path, monkeypatch):
+    """A small synthetic repo root as the working directory; yields (root, stats)."""
+    stats = build_synthetic_root(str(tmp_path), descriptors=8, binaries=8, posts=2, binary_size=256)
+    monkeypatch.chdir(tmp_path)
+    _reload_registries()
+    yield str(tmp_path), stats
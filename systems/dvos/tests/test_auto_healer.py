@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from engine import auto_healer
+from engine.auto_healer import apply_repairs, heal_assets, plan_repairs
+
+ASSET_ROOT = os.path.join("systems", "dvos", "assets")
+
+
+def test_plan_repairs_pairs_missing_files(synthetic_root):
+    plan = plan_repairs({
+        "missing_json": ["ui/new-button.svg", "ui/new-button.svg"],
+        "missing_binary": ["ui/lost-icon.svg", "backgrounds/lost-bg.jpg"],
+        "missing_svg": ["ui/asset-000000"],  # exists on disk: nothing to do
+    })
+
+    assert [(r["action"], r["asset"], r["path"]) for r in plan] == [
+        ("create_descriptor", "new-button", os.path.join(ASSET_ROOT, "ui", "new-button.json")),
+        ("create_stub_svg", "lost-icon", os.path.join(ASSET_ROOT, "ui", "lost-icon.svg")),
+    ]
+    descriptor = json.loads(plan[0]["content"])
+    assert descriptor["id"] == "new-button"
+    assert descriptor["path"] == "assets/ui/new-button.svg"
+    assert not os.path.exists(plan[0]["path"])
+
+
+def test_plan_repairs_empty_report():
+    assert plan_repairs(None) == []
+    assert plan_repairs({"missing_json": [], "missing_binary": []}) == []
+
+
+def test_dry_run_writes_nothing(synthetic_root):
+    mismatches = {"missing_json": ["ui/new-button.svg"], "missing_binary": ["ui/lost-icon.svg"]}
+    applied = []
+
+    assert heal_assets(mismatches, dry_run=True, applied=applied) == 2
+    assert applied == []
+    assert not os.path.exists(os.path.join(ASSET_ROOT, "ui", "new-button.json"))
+    assert not os.path.exists(os.path.join(ASSET_ROOT, "ui", "lost-icon.svg"))
+
+
+def test_apply_repairs_rolls_back_a_failed_batch(synthetic_root, monkeypatch):
+    plan = plan_repairs({"missing_binary": ["ui/first.svg", "ui/second.svg"]})
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if dst.endswith("second.svg"):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(auto_healer.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        apply_repairs(plan)
+
+    ui_dir = os.path.join(ASSET_ROOT, "ui")
+    assert not os.path.exists(os.path.join(ui_dir, "first.svg"))
+    assert not any(name.startswith(".heal-") for name in os.listdir(ui_dir))
+
+    # Non-strict heals report the rollback as zero repairs; strict ones re-raise
+    assert heal_assets({"missing_binary": ["ui/first.svg", "ui/second.svg"]}) == 0
+    with pytest.raises(OSError):
+        heal_assets({"missing_binary": ["ui/first.svg", "ui/second.svg"]}, strict=True)
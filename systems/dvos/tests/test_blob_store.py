@@ -0,0 +1,56 @@
+import os
+
+from engine.blob_store import blob_path, dedupe, get_config, load_manifest, materialize
+from engine.image_optimizer import file_digest
+
+CONTENT = os.urandom(4096)
+
+
+def write(path, content=CONTENT):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def test_dedupe_skips_pipeline_outputs(synthetic_root):
+    write("assets/images/a.png")
+    write("assets/optimized/a.png")
+    write("assets/responsive/a-960w.png")
+
+    result = dedupe(get_config())
+
+    assert result["duplicates"] == 0
+    assert os.stat("assets/optimized/a.png").st_nlink == 1
+
+
+def test_rewritten_blob_is_replaced_before_reuse(synthetic_root):
+    config = get_config()
+    write("assets/images/a.png")
+    write("systems/dvos/assets/logo/a.png")
+    dedupe(config)
+    sha = file_digest("assets/images/a.png")
+    blob = blob_path(sha, config["store"])
+    assert os.path.samefile(blob, "assets/images/a.png")
+
+    # An in-place edit rewrites the shared inode, so the blob no longer matches its name
+    with open("assets/images/a.png", "r+b") as f:
+        f.write(b"edited")
+    write("assets/images/b.png")
+    write("assets/images/c.png")
+    dedupe(config)
+
+    assert file_digest(blob) == sha
+    assert os.path.samefile(blob, "assets/images/b.png")
+    assert file_digest("assets/images/c.png") == sha
+
+
+def test_materialize_restores_deleted_duplicates(synthetic_root):
+    config = get_config()
+    write("assets/images/a.png")
+    write("systems/dvos/assets/logo/a.png")
+    dedupe(config)
+    assert "assets/images/a.png" in load_manifest(config["manifest"])
+
+    os.remove("assets/images/a.png")
+    assert materialize(config) == 1
+    assert file_digest("assets/images/a.png") == file_digest("systems/dvos/assets/logo/a.png")
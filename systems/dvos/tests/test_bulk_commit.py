@@ -0,0 +1,64 @@
+import os
+import subprocess
+
+import pytest
+
+from engine.bulk_commit import BulkCommitError, bulk_commit, rev_parse
+
+POSTS = {
+    "2026-01-01-first.md": "---\ntitle: First\n---\n\nOne.\n",
+    "2026-01-02-second.md": "---\ntitle: Second\n---\n\nTwo.\n",
+    "2026-01-02-third.md": "---\ntitle: Third\n---\n\nThree.\n",
+}
+
+
+@pytest.fixture
+def bare_repo(synthetic_root, tmp_path_factory):
+    """A local `git init --bare` target plus a _posts tree to backfill from the synthetic root."""
+    git_dir = str(tmp_path_factory.mktemp("remote") / "site.git")
+    subprocess.run(["git", "init", "--bare", "-q", "-b", "main", git_dir], check=True)
+    for name in os.listdir("_posts"):
+        os.remove(os.path.join("_posts", name))
+    for name, content in POSTS.items():
+        with open(os.path.join("_posts", name), "w") as f:
+            f.write(content)
+    return git_dir
+
+
+def git(git_dir, *args):
+    return subprocess.run(["git", f"--git-dir={git_dir}", *args], capture_output=True, text=True,
+                          check=True).stdout
+
+
+def test_per_day_commits_into_bare_repo(bare_repo):
+    result = bulk_commit(["_posts"], per_day=True, git_dir=bare_repo)
+
+    assert (result["commits"], result["files"]) == (2, 3)
+    assert result["head"] == rev_parse(bare_repo, "refs/heads/main")
+    assert git(bare_repo, "log", "--format=%s|%ad", "--date=short", "main").splitlines() == [
+        "[DVOS] Backfill 2026-01-02 (2 files)|2026-01-02",
+        "[DVOS] Backfill 2026-01-01 (1 file)|2026-01-01",
+    ]
+    assert git(bare_repo, "show", "main:_posts/2026-01-02-third.md") == POSTS["2026-01-02-third.md"]
+
+
+def test_rerun_is_a_no_op(bare_repo):
+    head = bulk_commit(["_posts"], per_day=True, git_dir=bare_repo)["head"]
+
+    assert bulk_commit(["_posts"], per_day=True, git_dir=bare_repo) == {"commits": 0, "files": 0, "head": head}
+    assert rev_parse(bare_repo, "refs/heads/main") == head
+
+
+def test_clean_filter_mismatch_rolls_back(bare_repo):
+    head = bulk_commit(["_posts"], git_dir=bare_repo)["head"]
+
+    # `git add` would upper-case posts through this filter; fast-import writes raw bytes
+    git(bare_repo, "config", "filter.upper.clean", "tr a-z A-Z")
+    with open(".gitattributes", "w") as f:
+        f.write("*.md filter=upper\n")
+    with open(os.path.join("_posts", "2026-01-03-fourth.md"), "w") as f:
+        f.write("---\ntitle: Fourth\n---\n")
+
+    with pytest.raises(BulkCommitError):
+        bulk_commit(["_posts"], git_dir=bare_repo)
+    assert rev_parse(bare_repo, "refs/heads/main") == head
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+
+
+def run_cli(*args):
+    """Run `python -m systems.dvos` with the synthetic root as the repo root (cwd)."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    return subprocess.run([sys.executable, "-m", "systems.dvos", *args],
+                          capture_output=True, text=True, env=env)
+
+
+def test_analyze_and_verify_from_repo_root(synthetic_root):
+    analyze = run_cli("analyze")
+    assert analyze.returncode == 0, analyze.stderr
+    assert os.path.isfile(os.path.join("systems", "dvos", "runtime", "merged-asset-map.json"))
+    assert not os.path.exists("runtime")
+
+    verify = run_cli("verify")
+    assert verify.returncode == 0, verify.stdout + verify.stderr
+
+
+def test_cycle_from_repo_root(synthetic_root):
+    cycle = run_cli("cycle")
+    assert cycle.returncode == 0, cycle.stdout + cycle.stderr
+    assert "Cycle complete" in cycle.stdout
@@ -0,0 +1,26 @@
+import os
+
+from engine.cycle_history import DEFAULT_DB_PATH, asset_history, healed_cycles, recent_cycles
+from systems.dvos.dvos_scheduler import run_dvos_cycle
+
+
+def test_cycle_records_heal_actions(synthetic_root):
+    run_dvos_cycle()
+    binary = os.path.join("systems", "dvos", "assets", "ui", "asset-000000.svg")
+    os.remove(binary)
+    run_dvos_cycle()
+
+    heals = healed_cycles(db_path=DEFAULT_DB_PATH)
+    assert [(action, asset, path) for _, _, action, asset, path in heals] == [
+        ("create_stub_svg", "asset-000000", binary.replace(os.sep, "/")),
+    ]
+    assert [row[2] for row in recent_cycles(db_path=DEFAULT_DB_PATH)][0] == "healed"
+    assert any(row[1] == "heal" for row in asset_history("asset-000000", db_path=DEFAULT_DB_PATH))
+
+
+def test_clean_cycle_records_no_heals(synthetic_root):
+    run_dvos_cycle()
+    run_dvos_cycle()
+
+    assert healed_cycles(db_path=DEFAULT_DB_PATH) == []
+    assert len(recent_cycles(db_path=DEFAULT_DB_PATH)) == 2
@@ -0,0 +1,51 @@
+import os
+import shutil
+import subprocess
+import sys
+
+from conftest import DVOS_DIR
+from engine import generate_content
+from engine.generate_content import NICHES, PUBLISH_TIME, RENDER_CACHE_DIR, generate, regenerate
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_same_seed_and_date_give_identical_bytes(synthetic_root):
+    first = generate("2026-03-01", "seed-a", content_dir="out-a")
+    shutil.rmtree(RENDER_CACHE_DIR)  # a cold cache must not change the output
+    second = generate("2026-03-01", "seed-a", content_dir="out-b")
+
+    assert os.path.basename(first) == os.path.basename(second)
+    assert read_bytes(first) == read_bytes(second)
+
+
+def test_editing_one_niche_rerenders_only_that_niche(synthetic_root, monkeypatch):
+    os.makedirs("generated")
+    paths = {}
+    for day, keyword in enumerate(NICHES, start=1):
+        paths[keyword] = os.path.join("generated", f"2026-04-{day:02d}-{generate_content.slugify(keyword)}.md")
+        generate_content.write_post(paths[keyword],
+                                    generate_content.generate_article(keyword, f"2026-04-{day:02d} {PUBLISH_TIME}"))
+    before = {keyword: read_bytes(path) for keyword, path in paths.items()}
+
+    edited = NICHES[0]
+    monkeypatch.setitem(generate_content.TOOLS, edited, [("Obsidian", "https://obsidian.md")])
+
+    assert regenerate("generated", workers=1) == [paths[edited]]
+    for keyword, path in paths.items():
+        assert (read_bytes(path) == before[keyword]) == (keyword != edited)
+    assert b"date: 2026-04-01 12:00:00" in read_bytes(paths[edited])
+    assert regenerate("generated", workers=1) == []
+
+
+def test_runs_as_a_script(synthetic_root):
+    root, _ = synthetic_root
+    script = os.path.join(DVOS_DIR, "engine", "generate_content.py")
+    result = subprocess.run([sys.executable, script, "--date", "2026-05-01"], cwd=root,
+                            capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "feed.xml and sitemap.xml updated" in result.stdout
@@ -0,0 +1,72 @@
+import json
+import os
+
+from engine.mismatch_scanner import DEFAULT_PAIRING_RULES, detect_mismatches, save_state
+
+RULES = dict(DEFAULT_PAIRING_RULES, backgrounds={
+    "binary": ["png", "jpg"], "descriptor": "json", "require_descriptor": True, "require_binary": True,
+})
+
+
+def touch(root, rel_path, content=""):
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content if isinstance(content, str) else json.dumps(content))
+
+
+def detect(root):
+    return detect_mismatches(RULES, asset_root=str(root / "assets"), state_path=str(root / "state.json"))
+
+
+def test_same_stem_in_different_directories(tmp_path):
+    assets = str(tmp_path / "assets")
+    touch(assets, "ui/icon.svg")
+    touch(assets, "ui/icon.json", {"id": "icon"})
+    touch(assets, "ui/nav/icon.svg")
+    touch(assets, "ui/menu/icon.json", {"id": "menu-icon"})
+
+    report = detect(tmp_path)
+
+    assert report["missing_json"] == {"ui/nav/icon.svg"}
+    assert report["missing_binary"] == {"ui/menu/icon.svg"}
+    assert (report["total_binaries"], report["total_descriptors"]) == (2, 2)
+
+
+def test_descriptor_claims_binary_through_path(tmp_path):
+    assets = str(tmp_path / "assets")
+    touch(assets, "backgrounds/grid-light.png")
+    touch(assets, "backgrounds/backgrounds.json", {"id": "backgrounds", "path": "assets/backgrounds/grid-light.png"})
+    touch(assets, "backgrounds/grid-dark.png")
+    touch(assets, "backgrounds/dark.json", {"id": "dark", "path": "systems/dvos/assets/backgrounds/grid-dark.png"})
+
+    report = detect(tmp_path)
+    assert report["missing_json"] == frozenset()
+    assert report["missing_binary"] == frozenset()
+
+    # A claim on a file that does not exist pairs nothing
+    touch(assets, "backgrounds/backgrounds.json", {"id": "backgrounds", "path": "assets/backgrounds/grid.png"})
+    report = detect(tmp_path)
+    assert report["missing_json"] == {"backgrounds/grid-light.png"}
+    assert report["missing_binary"] == {"backgrounds/backgrounds.png"}
+
+
+def test_new_mismatches_diff_against_saved_state(tmp_path):
+    assets = str(tmp_path / "assets")
+    touch(assets, "ui/first.svg")
+    touch(assets, "ui/lost.json", {"id": "lost"})
+
+    report = detect(tmp_path)
+    assert report["new_missing_json"] == {"ui/first.svg"}
+    assert report["new_missing_binary"] == {"ui/lost.svg"}
+    save_state(report)
+
+    touch(assets, "ui/second.svg")
+    touch(assets, "ui/first.json", {"id": "first"})
+    report = detect(tmp_path)
+
+    assert report["missing_json"] == {"ui/second.svg"}
+    assert report["new_missing_json"] == {"ui/second.svg"}
+    assert report["missing_binary"] == {"ui/lost.svg"}
+    assert report["new_missing_binary"] == frozenset()
+    assert report["resolved"] == {"ui/first.svg"}
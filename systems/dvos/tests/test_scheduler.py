@@ -0,0 +1,31 @@
+import os
+
+from systems.dvos.dvos_scheduler import run_dvos_cycle
+
+ASSET_DIR = os.path.join("systems", "dvos", "assets", "ui")
+
+
+def test_cycle_heals_deleted_asset(synthetic_root):
+    run_dvos_cycle()  # baseline: records the current mismatch state
+
+    binary = os.path.join(ASSET_DIR, "asset-000000.svg")
+    os.remove(binary)
+    cycle = run_dvos_cycle()
+
+    assert os.path.exists(binary)
+    assert cycle["healed"] == 1
+    assert cycle["status"] == "healed"
+
+
+def test_cycle_heals_deleted_descriptor(synthetic_root):
+    run_dvos_cycle()
+
+    descriptor = os.path.join(ASSET_DIR, "asset-000004.json")
+    os.remove(descriptor)
+    cycle = run_dvos_cycle()
+
+    assert os.path.exists(descriptor)
+    assert cycle["healed"] == 1
+
+    # The healed descriptor's DVOS-relative path must verify on the next cycle
+    assert run_dvos_cycle()["status"] == "ok"
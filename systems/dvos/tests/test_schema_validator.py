@@ -0,0 +1,71 @@
+import json
+import os
+
+from engine.schema_validator import DescriptorValidator, get_validator, reset_validators
+
+SCHEMA_PATH = os.path.join("systems", "dvos", "schema", "asset-map.json")
+CACHE_PATH = os.path.join("systems", "dvos", "runtime", "validation-cache.json")
+
+
+def validate(validator, descriptor):
+    return validator.validate(json.dumps(descriptor).encode("utf-8"), descriptor)
+
+
+def test_only_id_and_path_are_required(synthetic_root):
+    validator = DescriptorValidator(SCHEMA_PATH, CACHE_PATH)
+
+    assert validator.check({"id": "header-bg", "path": "assets/backgrounds/header-bg.jpg"}) == {}
+    assert validator.check({"path": "assets/ui/x.svg"}) == {"id": ["required field is missing"]}
+
+
+def test_reports_errors_per_field(synthetic_root):
+    validator = DescriptorValidator(SCHEMA_PATH, CACHE_PATH)
+    errors = validator.check({
+        "id": "Bad ID",
+        "path": "assets/ui/x.svg",
+        "version": 1,
+        "auto_optimize": "yes",
+        "last_updated": "yesterday",
+    })
+
+    assert set(errors) == {"id", "version", "auto_optimize", "last_updated"}
+    assert errors["version"] == ["expected str, got int"]
+    assert errors["auto_optimize"] == ["expected bool, got str"]
+    assert "does not match" in errors["id"][0]
+    assert validator.check(["not", "an", "object"]) == {"<root>": ["descriptor must be a JSON object"]}
+
+
+def test_results_are_cached_by_descriptor_bytes(synthetic_root):
+    descriptor = {"id": "asset-a", "path": "assets/ui/asset-a.svg", "version": 2}
+    validator = DescriptorValidator(SCHEMA_PATH, CACHE_PATH)
+    first = validate(validator, descriptor)
+    assert (validator.hits, validator.misses) == (0, 1)
+    assert validate(validator, descriptor) == first
+    assert (validator.hits, validator.misses) == (1, 1)
+    validator.save_cache()
+
+    reloaded = DescriptorValidator(SCHEMA_PATH, CACHE_PATH)
+    assert validate(reloaded, descriptor) == first
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_schema_change_invalidates_cache_and_validator(synthetic_root):
+    descriptor = {"id": "asset-a", "path": "assets/ui/asset-a.svg", "version": "1.0"}
+    reset_validators()
+    validator = get_validator(SCHEMA_PATH)
+    assert validate(validator, descriptor) == {}
+    validator.save_cache()
+
+    with open(SCHEMA_PATH, "r") as f:
+        schema = json.load(f)
+    schema["assets"][0]["version"] = 1  # versions are now numbers
+    with open(SCHEMA_PATH, "w") as f:
+        json.dump(schema, f)
+    os.utime(SCHEMA_PATH, ns=(0, os.stat(SCHEMA_PATH).st_mtime_ns + 1_000_000))
+
+    recompiled = get_validator(SCHEMA_PATH)
+    assert recompiled is not validator
+    reloaded = DescriptorValidator(SCHEMA_PATH, CACHE_PATH)
+    assert reloaded.cache == {}
+    assert validate(reloaded, descriptor) == {"version": ["expected int, got str"]}
+    reset_validators()
@@ -0,0 +1,48 @@
+import glob
+import os
+
+import pytest
+
+from engine.site_feeds import DEFAULT_FEEDS, add_post, build_feeds, derive_state, read_site_config
+
+POST = '---\nlayout: post\ntitle: "New & Improved"\ndate: 2026-01-{day:02d} 12:00:00\n---\n\nBody.\n'
+
+
+def read_outputs():
+    outputs = {}
+    for path in sorted(glob.glob("feed.xml") + glob.glob("sitemap*.xml")):
+        with open(path, "r", encoding="utf-8") as f:
+            outputs[path] = f.read()
+    return outputs
+
+
+def write_post(day):
+    path = os.path.join("_posts", f"2026-01-{day:02d}-new-post-{day}.md")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(POST.format(day=day))
+    return path
+
+
+@pytest.mark.parametrize("chunk", [50000, 3])
+def test_add_post_matches_full_rebuild(synthetic_root, chunk):
+    config = dict(DEFAULT_FEEDS, feed_entries=2, sitemap_chunk=chunk)
+    build_feeds(config)
+
+    # No runtime state: the committed outputs alone are enough to resume from
+    assert derive_state(read_site_config(), config)["posts"] == 2
+    for day in (1, 2, 3):
+        add_post(write_post(day), config)
+    incremental = read_outputs()
+
+    build_feeds(config)
+    assert read_outputs() == incremental
+
+
+def test_add_post_rebuilds_when_outputs_do_not_match_config(synthetic_root):
+    config = dict(DEFAULT_FEEDS, feed_entries=1)
+    build_feeds(config)
+
+    config["feed_entries"] = 5
+    assert derive_state(read_site_config(), config) is None
+    result = add_post(write_post(1), config)
+    assert result == {"posts": 3, "feed_entries": 3, "sitemap_chunks": 1}